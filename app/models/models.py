@@ -3,6 +3,13 @@ from datetime import datetime, timezone
 
 class Oferta(db.Model):
     __tablename__ = 'ofertas'
+
+    # Estados de la descripción (columna descripcion_estado)
+    DESC_PENDIENTE = 'pendiente'   # solo placeholder del listado, falta el detalle
+    DESC_OBTENIDA = 'obtenida'     # texto real, lista para analizar
+    DESC_FALLIDA = 'fallida'       # el detalle falló; se reintenta según detalle_fallos
+    DESC_ELIMINADA = 'eliminada'   # 404/410: la oferta ya no existe
+
     id = db.Column(db.Integer, primary_key=True)
     titulo = db.Column(db.String(255), nullable=False)
     empresa = db.Column(db.String(255))
@@ -11,7 +18,10 @@ class Oferta(db.Model):
     raw_fecha = db.Column(db.String(50))
     url = db.Column(db.String(512), unique=True)
     descripcion = db.Column(db.Text)
+    descripcion_estado = db.Column(db.String(20), default='pendiente', nullable=False, index=True)
     fuente = db.Column(db.String(50))
+    # Si la oferta es una re-publicación casi idéntica de otra, id de la original
+    duplicado_de = db.Column(db.Integer, db.ForeignKey('ofertas.id', name='fk_ofertas_duplicado_de'), index=True)
 
 class Busqueda(db.Model):
     __tablename__ = 'busquedas'
@@ -106,9 +116,47 @@ class AnalisisResultado(db.Model):
     marketing_digital = db.Column(db.Text)
     erp_lowcode = db.Column(db.Text)
 
+    # Versión de taxonomia.json con la que se extrajo el stack (NULL = anterior a la taxonomía)
+    taxonomia_version = db.Column(db.Integer, index=True)
+    # Versión de la lógica de run_processing y sha256 de título + descripción analizados
+    version_analizador = db.Column(db.Integer)
+    hash_contenido = db.Column(db.String(64))
+
     # Fecha de creación de este análisis
     fecha_analisis = db.Column(db.DateTime, default=datetime.utcnow)
 
+# ----------------- PERFILES DE CANDIDATO -----------------
+
+class Perfil(db.Model):
+    __tablename__ = 'perfiles'
+
+    # Perfil cuyo puntaje se copia también a analisis_resultados.compatibilidad
+    PRINCIPAL = 'principal'
+
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(100), unique=True, nullable=False)
+    skills = db.Column(db.JSON, nullable=False)  # {categoria: [skills]}
+    pesos_categoria = db.Column(db.JSON)         # {categoria: peso}; 1 si falta
+    pesos_skill = db.Column(db.JSON)             # {skill: peso}; 1 si falta
+    max_score = db.Column(db.Float, default=100, nullable=False)
+    activo = db.Column(db.Boolean, default=True, nullable=False)
+    creado_en = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class PuntajePerfil(db.Model):
+    __tablename__ = 'puntajes_perfil'
+    __table_args__ = (db.UniqueConstraint('perfil_id', 'analisis_id', name='uq_puntajes_perfil_perfil_analisis'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    perfil_id = db.Column(db.Integer, db.ForeignKey('perfiles.id'), nullable=False)
+    analisis_id = db.Column(db.Integer, db.ForeignKey('analisis_resultados.id'), nullable=False, index=True)
+    compatibilidad = db.Column(db.Float, nullable=False)
+    calculado_en = db.Column(db.DateTime, default=datetime.utcnow)
+
+    perfil = db.relationship('Perfil', backref=db.backref('puntajes', lazy='dynamic'))
+    analisis = db.relationship('AnalisisResultado', backref=db.backref('puntajes_perfil', lazy=True))
+
+
 # ----------------- NUEVAS TABLAS DE METRICAS -----------------
 
 class MetricasTecnologia(db.Model):
@@ -142,3 +190,15 @@ class MetricasGenerales(db.Model):
     total_ofertas = db.Column(db.Integer, default=0)
     promedio_compatibilidad = db.Column(db.Float, default=0.0)
     fecha_calculo = db.Column(db.DateTime, default=datetime.utcnow)
+
+# ----------------- CACHÉ NEGATIVO DE DETALLES -----------------
+
+class DetalleFallo(db.Model):
+    __tablename__ = 'detalle_fallos'
+    id = db.Column(db.Integer, primary_key=True)
+    url = db.Column(db.String(512), unique=True, nullable=False)
+    fallos = db.Column(db.Integer, default=0, nullable=False)
+    ultimo_estado = db.Column(db.Integer)  # HTTP status; NULL = error de red/timeout
+    ultimo_intento = db.Column(db.DateTime, default=datetime.utcnow)
+    proximo_intento = db.Column(db.DateTime, index=True)
+    permanente = db.Column(db.Boolean, default=False, nullable=False)  # 404/410: no reintentar
@@ -0,0 +1,39 @@
+# app/process_pool.py
+"""
+Pool de procesos compartido por el scraper (parseo de HTML) y el procesamiento
+(análisis de ofertas). Las funciones que se le pasan deben ser de nivel de módulo
+(picklables). Con workers=0 todo corre en el hilo que llama (útil para depurar o
+en máquinas de un solo núcleo).
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+class ProcessPool:
+    """
+    ProcessPoolExecutor con run/map. `start_method` ("fork", "spawn", ...) elige cómo se
+    crean los procesos; None usa el de la plataforma. "spawn" no hereda hilos, sesiones
+    ni conexiones abiertas del proceso que crea el pool.
+    """
+
+    def __init__(self, workers: int, start_method: str = None):
+        self.workers = workers
+        context = multiprocessing.get_context(start_method) if start_method else None
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=context) if workers > 0 else None
+
+    def run(self, fn, *args):
+        """Ejecuta fn(*args) en un proceso y espera el resultado (bloquea solo al hilo que llama)."""
+        if self.executor is None:
+            return fn(*args)
+        return self.executor.submit(fn, *args).result()
+
+    def map(self, fn, items, chunksize: int = 8):
+        """Procesamiento masivo, con los resultados en el orden de `items`."""
+        if self.executor is None:
+            return map(fn, items)
+        return self.executor.map(fn, items, chunksize=chunksize)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,80 @@
+"""
+Analizador de ofertas en una sola pasada: stack, modalidad y nivel.
+El título y la descripción se normalizan una vez y un único matcher (palabras de la
+taxonomía + palabras de nivel) recorre "titulo descripcion" una sola vez. Cada
+aparición se reparte por posición: el nivel usa todo el texto y el stack solo lo
+que cae dentro de la descripción. La modalidad sale del mismo texto normalizado.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .matcher import KeywordMatcher
+from .nivel_detector import NIVEL_KEYWORDS, score_de_palabras
+from .taxonomia import Taxonomia, get_taxonomia
+from .utils import normalize_text
+
+# Modalidad → frases (como subcadenas); gana la primera modalidad con alguna frase presente
+MODALIDADES = (
+    ("Remoto", ("remoto", "teletrabajo", "home office")),
+    ("Híbrido", ("híbrido", "mixto")),
+    ("Presencial", ("presencial", "en oficina")),
+)
+
+
+@dataclass(frozen=True)
+class AnalisisTexto:
+    modalidad: Optional[str]
+    stack: Dict[str, List[str]]  # categoría → tecnologías
+    nivel_score: int
+
+    def columnas(self) -> dict:
+        """Columnas de AnalisisResultado (el stack como "a, b" por categoría)."""
+        return {
+            "modalidad": self.modalidad,
+            **{cat: ", ".join(techs) for cat, techs in self.stack.items()},
+            "nivel_score": self.nivel_score,
+        }
+
+
+class Analizador:
+
+    def __init__(self, taxonomia: Taxonomia = None):
+        self.taxonomia = taxonomia or get_taxonomia()
+        self.matcher = KeywordMatcher(
+            list(self.taxonomia.matcher.keywords) + [kw for kws in NIVEL_KEYWORDS.values() for kw in kws]
+        )
+
+    @staticmethod
+    def detectar_modalidad(descripcion_norm: str) -> Optional[str]:
+        for modalidad, frases in MODALIDADES:
+            if any(frase in descripcion_norm for frase in frases):
+                return modalidad
+        return None
+
+    def analizar(self, titulo: str, descripcion: str) -> AnalisisTexto:
+        descripcion_norm = normalize_text(descripcion)
+        titulo_norm = normalize_text(titulo)
+        texto = f"{titulo_norm} {descripcion_norm}"
+        inicio_descripcion = len(titulo_norm) + 1
+
+        en_texto, en_descripcion = set(), set()
+        for kw, inicio, _ in self.matcher.find_spans(texto):
+            en_texto.add(kw)
+            if inicio >= inicio_descripcion:
+                en_descripcion.add(kw)
+
+        return AnalisisTexto(
+            modalidad=self.detectar_modalidad(descripcion_norm),
+            stack=self.taxonomia.clasificar(en_descripcion),
+            nivel_score=score_de_palabras(en_texto),
+        )
+
+
+_analizador = None
+
+
+def get_analizador() -> Analizador:
+    global _analizador
+    if _analizador is None:
+        _analizador = Analizador()
+    return _analizador
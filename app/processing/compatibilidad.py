@@ -0,0 +1,101 @@
+"""
+Compatibilidad vectorizada: ofertas como matriz dispersa oferta × skill (CSR) y el
+perfil como vector de pesos (peso de categoría × peso de skill). El puntaje de stack
+de todas las ofertas sale de un solo producto matriz-vector (o matriz-matriz, con una
+columna de pesos por perfil); el ajuste por nivel (compute_final_score) se aplica
+después sobre el resultado completo.
+Los resultados coinciden con scripts/calc_compatibilidad.calcular_compatibilidad.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class MatrizOfertas:
+    """
+    Matriz binaria oferta × (categoría, skill) en formato CSR: `indptr` e `indices`
+    (los valores son todos 1). El vocabulario crece a medida que se agregan ofertas.
+    """
+
+    def __init__(self, categorias: Sequence[str]):
+        self.categorias = tuple(categorias)
+        self.vocabulario: Dict[Tuple[str, str], int] = {}
+        self._indptr: List[int] = [0]
+        self._indices: List[int] = []
+        self._arrays = None
+        # (categoría, "a, b") → columnas: muchas ofertas repiten exactamente el mismo texto
+        self._cache: Dict[Tuple[str, str], List[int]] = {}
+
+    def __len__(self):
+        return len(self._indptr) - 1
+
+    def _columnas(self, categoria: str, valor: str) -> List[int]:
+        columnas = []
+        for skill in dict.fromkeys(s.lower() for s in valor.split(", ")):
+            columnas.append(self.vocabulario.setdefault((categoria, skill), len(self.vocabulario)))
+        self._cache[(categoria, valor)] = columnas
+        return columnas
+
+    def agregar(self, valores: Sequence[Optional[str]]):
+        """Agrega una oferta: sus columnas de AnalisisResultado ("a, b") en el orden de `categorias`."""
+        indices, cache = self._indices, self._cache
+        for categoria, valor in zip(self.categorias, valores):
+            if valor:
+                columnas = cache.get((categoria, valor))
+                indices.extend(columnas if columnas is not None else self._columnas(categoria, valor))
+        self._indptr.append(len(indices))
+        self._arrays = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(indptr, indices) como arrays de numpy; se construyen una vez por cada estado de la matriz."""
+        if self._arrays is None:
+            self._arrays = (np.asarray(self._indptr, dtype=np.int64), np.asarray(self._indices, dtype=np.int64))
+        return self._arrays
+
+    def producto(self, pesos: np.ndarray) -> np.ndarray:
+        """Matriz × pesos (vector de largo len(vocabulario), o matriz vocabulario × k)."""
+        indptr, indices = self.arrays()
+        resultado = np.zeros((len(self),) + pesos.shape[1:], dtype=np.float64)
+        if not len(indices):
+            return resultado
+        no_vacias = indptr[:-1] < indptr[1:]
+        # reduceat suma cada tramo [indptr[i], indptr[i+1]); las filas vacías se dejan en 0
+        resultado[no_vacias] = np.add.reduceat(pesos[indices], indptr[:-1][no_vacias], axis=0)
+        return resultado
+
+
+def vector_perfil(vocabulario: Dict[Tuple[str, str], int], perfil: Dict[str, List[str]],
+                  pesos_categoria: Dict[str, float] = None, pesos_skill: Dict[str, float] = None) -> np.ndarray:
+    """Peso de cada columna del vocabulario para el perfil (0 si el perfil no tiene esa skill)."""
+    pesos_categoria = pesos_categoria or {}
+    pesos_skill = pesos_skill or {}
+    pesos = np.zeros(len(vocabulario), dtype=np.float64)
+    for categoria, skills in perfil.items():
+        peso_categoria = pesos_categoria.get(categoria, 1)
+        for skill in skills:
+            columna = vocabulario.get((categoria, skill.lower()))
+            if columna is not None:
+                pesos[columna] += pesos_skill.get(skill, 1) * peso_categoria
+    return pesos
+
+
+def ajustar_por_nivel(stack: np.ndarray, niveles: np.ndarray) -> np.ndarray:
+    """compute_final_score aplicado a todo el vector (niveles con la forma de las filas de stack)."""
+    niveles = niveles.reshape(niveles.shape + (1,) * (stack.ndim - niveles.ndim))
+    return np.select(
+        [niveles >= 3, niveles >= 1, niveles == 0, niveles <= -3],
+        [np.minimum(100, stack + stack * 0.15), np.minimum(100, stack + stack * 0.10),
+         stack, np.maximum(0, stack - stack * 0.20)],
+        default=np.maximum(0, stack - stack * 0.10),
+    )
+
+
+def calcular_compatibilidades(matriz: MatrizOfertas, niveles: Iterable[int], pesos: np.ndarray,
+                              max_score=100) -> np.ndarray:
+    """
+    Puntaje final de cada oferta (stack ponderado, tope, ajuste por nivel), redondeado a 2 decimales.
+    Con `pesos` vocabulario × perfiles devuelve ofertas × perfiles; `max_score` puede ser un tope por perfil.
+    """
+    stack = np.minimum(matriz.producto(pesos), max_score)
+    niveles = np.fromiter((n or 0 for n in niveles), dtype=np.int64, count=len(matriz))
+    return np.round(ajustar_por_nivel(stack, niveles), 2)
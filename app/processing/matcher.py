@@ -0,0 +1,74 @@
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Busca muchas palabras clave en una sola pasada sobre el texto.
+    Devuelve exactamente las mismas coincidencias que probar cada palabra por separado
+    con re.search(r"\\b" + re.escape(kw) + r"\\b", texto), pero con un único regex
+    compilado una vez:
+    - las palabras se organizan en un trie, así en cada posición el motor descarta
+      por el primer carácter en lugar de probar todas las alternativas;
+    - un lookahead por posición encuentra la palabra más larga que empieza ahí;
+    - las más cortas que empiezan en la misma posición (sus prefijos) se verifican aparte.
+    El texto debe venir normalizado igual que las palabras (minúsculas).
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted({kw.lower() for kw in keywords if kw})
+        trie: Dict = {}
+        for kw in self.keywords:
+            node = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = True  # fin de palabra
+        self.pattern = re.compile(r"\b(?=(" + self._trie_regex(trie) + "))") if self.keywords else None
+
+        # Para cada palabra, las palabras más cortas que son prefijo suyo
+        keyword_set = set(self.keywords)
+        self.prefixes = {
+            kw: [kw[:i] for i in range(1, len(kw)) if kw[:i] in keyword_set]
+            for kw in self.keywords
+        }
+        self.prefix_patterns = {
+            p: re.compile(re.escape(p) + r"\b")
+            for prefs in self.prefixes.values() for p in prefs
+        }
+
+    @classmethod
+    def _trie_regex(cls, node: Dict) -> str:
+        # Primero las ramas (palabras más largas) y al final "terminar aquí": el regex
+        # retrocede a la más corta solo si la larga no cierra con \b.
+        branches = [re.escape(ch) + cls._trie_regex(child) for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            branches.append(r"\b")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    def find_all(self, text: str) -> Set[str]:
+        """Conjunto de palabras clave presentes en `text` (con límites de palabra)."""
+        found: Set[str] = set()
+        if not text or self.pattern is None:
+            return found
+        for m in self.pattern.finditer(text):
+            kw = m.group(1)
+            found.add(kw)
+            for p in self.prefixes[kw]:
+                if p not in found and self.prefix_patterns[p].match(text, m.start()):
+                    found.add(p)
+        return found
+
+    def find_spans(self, text: str) -> List[Tuple[str, int, int]]:
+        """Todas las apariciones como (palabra, inicio, fin), ordenadas por posición."""
+        spans: List[Tuple[str, int, int]] = []
+        if not text or self.pattern is None:
+            return spans
+        for m in self.pattern.finditer(text):
+            start = m.start()
+            for p in self.prefixes[m.group(1)]:
+                if self.prefix_patterns[p].match(text, start):
+                    spans.append((p, start, start + len(p)))
+            spans.append((m.group(1), start, m.end(1)))
+        return spans
@@ -1,4 +1,5 @@
-import re
+from typing import Dict, Iterable, List, Tuple
+from .matcher import KeywordMatcher
 from .utils import normalize_text
 
 # Palabras clave por nivel (español e inglés)
@@ -29,9 +30,50 @@ NIVEL_KEYWORDS = {
 }
 
 
-def calcular_nivel_score(texto_completo: str) -> int:
+# Reglas por lista: (puntos por palabra distinta encontrada, máximo de palabras que suman)
+NIVEL_REGLAS = {
+    "junior_positivo": (2, 3),   # +2 por cada una, máx 3 matches
+    "junior_negativo": (-3, 2),  # -3 por cada una, máx 2 matches
+    "mid_keywords": (-1, 1),     # neutro, pero baja el score una sola vez
+    "senior_keywords": (-2, 2),  # -2 por cada una, máx 2 matches
+}
+
+# Todas las listas en un solo matcher compilado; cada palabra sabe a qué listas pertenece
+_MATCHER = KeywordMatcher(kw for kws in NIVEL_KEYWORDS.values() for kw in kws)
+_LISTAS_POR_PALABRA: Dict[str, List[str]] = {}
+for _lista, _kws in NIVEL_KEYWORDS.items():
+    for _kw in _kws:
+        _LISTAS_POR_PALABRA.setdefault(_kw.lower(), []).append(_lista)
+
+
+def score_de_palabras(encontradas: Iterable[str]) -> int:
+    """Score a partir de las palabras clave encontradas (las de NIVEL_KEYWORDS; el resto se ignora)."""
+    por_lista = {lista: set() for lista in NIVEL_REGLAS}
+    for kw in encontradas:
+        for lista in _LISTAS_POR_PALABRA.get(kw, ()):
+            por_lista[lista].add(kw)
+    score = sum(puntos * min(len(por_lista[lista]), maximo) for lista, (puntos, maximo) in NIVEL_REGLAS.items())
+    # Limitar rango a [-10, +10]
+    return max(-10, min(10, score))
+
+
+def evidencia_nivel(texto: str, normalizado: bool = False) -> Dict[str, List[Tuple[str, int, int]]]:
+    """
+    Lista → apariciones (palabra, inicio, fin) que justifican el score.
+    Las posiciones son sobre el texto normalizado (normalize_text).
+    """
+    texto = texto if normalizado else normalize_text(texto)
+    evidencia: Dict[str, List[Tuple[str, int, int]]] = {lista: [] for lista in NIVEL_REGLAS}
+    for kw, inicio, fin in _MATCHER.find_spans(texto):
+        for lista in _LISTAS_POR_PALABRA[kw]:
+            evidencia[lista].append((kw, inicio, fin))
+    return evidencia
+
+
+def calcular_nivel_score(texto_completo: str, normalizado: bool = False) -> int:
     """
     Analiza el texto (título + descripción) y devuelve un score de nivel.
+    `normalizado=True` si el texto ya pasó por normalize_text.
     
     Retorna:
         +10 a +5: Claramente junior
@@ -42,46 +84,23 @@ def calcular_nivel_score(texto_completo: str) -> int:
     """
     if not texto_completo:
         return 0
-    
-    texto = normalize_text(texto_completo)
-    
-    score = 0
-    
-    # Buscar keywords junior positivas (+2 por cada una, máx 3 matches)
-    junior_pos_count = 0
-    for kw in NIVEL_KEYWORDS["junior_positivo"]:
-        pattern = r"\b" + re.escape(kw.lower()) + r"\b"
-        if re.search(pattern, texto) and junior_pos_count < 3:
-            score += 2
-            junior_pos_count += 1
-    
-    # Buscar keywords junior negativas (-3 por cada una, máx 2 matches)
-    junior_neg_count = 0
-    for kw in NIVEL_KEYWORDS["junior_negativo"]:
-        pattern = r"\b" + re.escape(kw.lower()) + r"\b"
-        if re.search(pattern, texto) and junior_neg_count < 2:
-            score -= 3
-            junior_neg_count += 1
-    
-    # Buscar keywords mid (neutro, pero baja score si es muy alto)
-    for kw in NIVEL_KEYWORDS["mid_keywords"]:
-        pattern = r"\b" + re.escape(kw.lower()) + r"\b"
-        if re.search(pattern, texto):
-            score -= 1
-            break  # Solo una vez
-    
-    # Buscar keywords senior (-2 por cada una, máx 2 matches)
-    senior_count = 0
-    for kw in NIVEL_KEYWORDS["senior_keywords"]:
-        pattern = r"\b" + re.escape(kw.lower()) + r"\b"
-        if re.search(pattern, texto) and senior_count < 2:
-            score -= 2
-            senior_count += 1
-    
-    # Limitar rango a [-10, +10]
-    score = max(-10, min(10, score))
-    
-    return score
+    texto = texto_completo if normalizado else normalize_text(texto_completo)
+    return score_de_palabras(_MATCHER.find_all(texto))
+
+
+def calcular_nivel_scores(textos: Iterable[str], normalizado: bool = False, con_evidencia: bool = False) -> list:
+    """
+    Versión por lotes de calcular_nivel_score: una lista de scores en el mismo orden,
+    o de (score, evidencia) con `con_evidencia=True` (ver evidencia_nivel).
+    """
+    if not con_evidencia:
+        return [calcular_nivel_score(t, normalizado) for t in textos]
+    resultados = []
+    for t in textos:
+        evidencia = evidencia_nivel(t or "", normalizado)
+        score = score_de_palabras(kw for spans in evidencia.values() for kw, _, _ in spans)
+        resultados.append((score, evidencia))
+    return resultados
 
 
 def interpretar_nivel_score(score: int) -> str:
@@ -0,0 +1,108 @@
+"""
+Taxonomía versionada de tecnologías (taxonomia.json): categoría → tecnología → sinónimos.
+Es la única fuente de los diccionarios de tech_extractor y run_processing.
+Cada versión registra en "cambios" las palabras clave que cambiaron respecto de la
+anterior; con eso se sabe qué ofertas pueden dar otro resultado al re-analizar.
+"""
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .matcher import KeywordMatcher
+from .utils import normalize_text
+
+TAXONOMIA_PATH = os.path.join(os.path.dirname(__file__), "taxonomia.json")
+
+# Resultados sin versión: se analizaron con los diccionarios anteriores a la taxonomía
+VERSION_INICIAL = 1
+
+_TOKEN = re.compile(r"\w+")
+
+
+class Taxonomia:
+
+    def __init__(self, version: int, categorias: Dict[str, Dict[str, List[str]]], cambios: Dict[int, List[str]]):
+        self.version = version
+        self.categorias = categorias
+        self.cambios = cambios
+        self.matcher = KeywordMatcher(
+            syn for techs in categorias.values() for syns in techs.values() for syn in syns
+        )
+        # Palabra clave → (categoría, tecnología) a las que apunta
+        self.destinos: Dict[str, List[Tuple[str, str]]] = {}
+        for category, techs in categorias.items():
+            for tech, syns in techs.items():
+                for syn in syns:
+                    self.destinos.setdefault(syn.lower(), []).append((category, tech))
+
+    @classmethod
+    def load(cls, path: str = TAXONOMIA_PATH) -> "Taxonomia":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cambios = {int(v): palabras for v, palabras in data.get("cambios", {}).items()}
+        return cls(data["version"], data["categorias"], cambios)
+
+    def extraer(self, texto: str, normalizado: bool = False) -> Dict[str, List[str]]:
+        """
+        Categoría → tecnologías presentes en el texto (ordenadas, sin repetir).
+        `normalizado=True` si el texto ya pasó por normalize_text.
+        """
+        if not texto:
+            return {cat: [] for cat in self.categorias}
+        return self.clasificar(self.matcher.find_all(texto if normalizado else normalize_text(texto)))
+
+    def clasificar(self, keywords: Set[str]) -> Dict[str, List[str]]:
+        """Categoría → tecnologías con algún sinónimo entre las palabras clave encontradas."""
+        found: Dict[str, Set[str]] = {cat: set() for cat in self.categorias}
+        for kw in keywords:
+            for category, tech in self.destinos.get(kw, ()):
+                found[category].add(tech)
+        return {cat: sorted(techs) for cat, techs in found.items()}
+
+    def palabras_cambiadas(self, desde_version) -> Set[str]:
+        """Palabras clave que cambiaron después de `desde_version` (None = versión inicial)."""
+        desde = desde_version or VERSION_INICIAL
+        return {
+            kw.lower() for v, palabras in self.cambios.items()
+            if desde < v <= self.version for kw in palabras
+        }
+
+
+def tokens(texto: str) -> Set[str]:
+    return set(_TOKEN.findall(texto))
+
+
+def indice_invertido(textos: Dict[int, str]) -> Dict[str, Set[int]]:
+    """token → ids cuyos textos (ya normalizados) lo contienen."""
+    indice: Dict[str, Set[int]] = {}
+    for key, texto in textos.items():
+        for tok in tokens(texto):
+            indice.setdefault(tok, set()).add(key)
+    return indice
+
+
+def candidatas(indice: Dict[str, Set[int]], palabras: Iterable[str], todas: Set[int]) -> Set[int]:
+    """
+    Ids cuyos textos contienen todos los tokens de alguna de las palabras.
+    Es un superconjunto de los textos donde la palabra aparece con límites de palabra;
+    una palabra sin tokens (solo símbolos) no se puede filtrar y devuelve todas.
+    """
+    resultado: Set[int] = set()
+    for palabra in palabras:
+        toks = tokens(palabra.lower())
+        if not toks:
+            return set(todas)
+        postings = sorted((indice.get(t, set()) for t in toks), key=len)
+        resultado |= set.intersection(*postings)
+    return resultado
+
+
+_taxonomia = None
+
+
+def get_taxonomia() -> Taxonomia:
+    global _taxonomia
+    if _taxonomia is None:
+        _taxonomia = Taxonomia.load()
+    return _taxonomia
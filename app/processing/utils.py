@@ -1,5 +1,3 @@
-import re
-
 def normalize_text(text: str) -> str:
     """
     Normaliza texto para búsqueda de tecnologías:
@@ -11,7 +9,6 @@ def normalize_text(text: str) -> str:
         return ""
     
     text = text.lower()
-    text = re.sub(r"#", " sharp", text)  # c# → c sharp
-    text = re.sub(r"\s+", " ", text)     # normaliza espacios
-    text = text.strip()
-    return text
+    text = text.replace("#", " sharp")  # c# → c sharp
+    # normaliza espacios: split() corta en los mismos blancos que \s y descarta los extremos
+    return " ".join(text.split())
@@ -0,0 +1,119 @@
+# app/scrapers/computrabajo/archive.py
+"""
+Archivo local del HTML crudo de cada página descargada.
+- Los bodies se guardan por contenido: objects/ab/<sha256>.gz (o .zst si está
+  instalado `zstandard`); dos descargas idénticas ocupan un solo archivo.
+- index.sqlite3 registra cada descarga: url, sha256, tipo (list/detail) y fecha.
+Sirve para re-ejecutar la extracción sin red (scripts/reextract_archive.py).
+"""
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from .config import HTML_ARCHIVE_DIR
+
+try:
+    import zstandard
+except ImportError:  # dependencia opcional: gzip alcanza
+    zstandard = None
+
+
+class HtmlArchive:
+    def __init__(self, directory: str = HTML_ARCHIVE_DIR):
+        self.directory = directory
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(directory, "index.sqlite3"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS paginas ("
+            " url TEXT NOT NULL, sha256 TEXT NOT NULL, tipo TEXT NOT NULL, descargada_en REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS ix_paginas_url ON paginas (url, descargada_en)")
+        self.conn.commit()
+
+    def _blob_path(self, sha: str, ext: str) -> str:
+        return os.path.join(self.directory, "objects", sha[:2], sha + ext)
+
+    def _find_blob(self, sha: str):
+        for ext in (".zst", ".gz"):
+            path = self._blob_path(sha, ext)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def put(self, url: str, body: bytes, tipo: str) -> str:
+        """Guarda el body (si no existía ya) y registra la descarga. Devuelve el sha256."""
+        sha = hashlib.sha256(body).hexdigest()
+        if self._find_blob(sha) is None:
+            if zstandard is not None:
+                path, data = self._blob_path(sha, ".zst"), zstandard.ZstdCompressor(level=10).compress(body)
+            else:
+                path, data = self._blob_path(sha, ".gz"), gzip.compress(body, compresslevel=6)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO paginas (url, sha256, tipo, descargada_en) VALUES (?, ?, ?, ?)",
+                (url, sha, tipo, time.time()),
+            )
+            self.conn.commit()
+        return sha
+
+    def read(self, sha: str) -> bytes:
+        return read_blob(self.directory, sha)
+
+    def latest(self, tipo: str = None):
+        """Lista de (url, sha256, descargada_en) con la descarga más reciente de cada URL."""
+        sql = "SELECT url, sha256, MAX(descargada_en) FROM paginas"
+        params = ()
+        if tipo:
+            sql += " WHERE tipo = ?"
+            params = (tipo,)
+        sql += " GROUP BY url"
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def stats(self) -> dict:
+        with self.lock:
+            descargas, urls, blobs = self.conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT url), COUNT(DISTINCT sha256) FROM paginas"
+            ).fetchone()
+        return {"descargas": descargas, "urls": urls, "blobs": blobs}
+
+
+def read_blob(directory: str, sha: str) -> bytes:
+    """Lectura sin índice ni conexión sqlite (para usar dentro de procesos del pool)."""
+    for ext in (".zst", ".gz"):
+        path = os.path.join(directory, "objects", sha[:2], sha + ext)
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        if ext == ".zst":
+            if zstandard is None:
+                raise RuntimeError("Se necesita `zstandard` para leer " + path)
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+    raise FileNotFoundError(sha)
+
+
+_default_archive = None
+_default_lock = threading.Lock()
+
+
+def get_default_archive():
+    """Archivo compartido por ambos scrapers; None si HTML_ARCHIVE_DIR está desactivado."""
+    global _default_archive
+    if not HTML_ARCHIVE_DIR:
+        return None
+    with _default_lock:
+        if _default_archive is None:
+            _default_archive = HtmlArchive()
+        return _default_archive
@@ -0,0 +1,55 @@
+# app/scrapers/computrabajo/checkpoint.py
+import json
+import os
+import threading
+
+from .config import CHECKPOINT_PATH
+
+
+class CrawlCheckpoint:
+    """
+    Frontera del crawl persistida en un JSON local para poder reanudar (--resume).
+    Sección "crawl": estado de cada término (página actual, ofertas recolectadas) y URLs vistas.
+    Los detalles no necesitan checkpoint: su cola es ofertas.descripcion_estado.
+    Cada escritura es atómica (archivo temporal + os.replace).
+    """
+
+    def __init__(self, path: str = CHECKPOINT_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def load(self, section: str):
+        with self.lock:
+            return self._read().get(section)
+
+    def save(self, section: str, state):
+        with self.lock:
+            data = self._read()
+            data[section] = state
+            self._write(data)
+
+    def clear(self, section: str):
+        with self.lock:
+            data = self._read()
+            if data.pop(section, None) is None:
+                return
+            if data:
+                self._write(data)
+            else:
+                os.remove(self.path)
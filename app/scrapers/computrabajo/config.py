@@ -1,3 +1,5 @@
+import os
+
 TERM = "desarrollador-de-software"
 LOCATION = "antioquia"
 
@@ -9,4 +11,57 @@ BLACKLIST_COMPANIES = [
     "ZEMSANIA"
 ]
 
-REQUEST_DELAY = (1, 5) 
+# Hora local de las ofertas (Colombia, sin horario de verano): fechas sin hora se comparan por día local
+LOCAL_UTC_OFFSET_HOURS = -5
+
+# Detalle de ofertas: requests concurrentes bajo un mismo rate limit por host
+DETAIL_WORKERS = 4
+DETAIL_RATE = 1.0   # techo de requests por segundo por host (el pacer ajusta por debajo)
+DETAIL_BURST = 2    # ráfaga máxima del token bucket
+
+# Caché HTTP en disco (GET condicionales con ETag / Last-Modified)
+HTTP_CACHE_DIR = ".cache/http"
+HTTP_CACHE_TTL = 7 * 24 * 3600       # segundos
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Crawl de listados: todos los términos en paralelo con un presupuesto global
+CRAWL_WORKERS = 2
+CRAWL_RPM = 40      # techo de requests por minuto para todo el crawl (el pacer ajusta por debajo)
+CRAWL_BURST = 2
+
+# Modo incremental: parar de paginar un término tras N páginas solo con URLs ya guardadas
+INCREMENTAL = True
+INCREMENTAL_STOP_PAGES = 1
+
+# Filas por executemany al guardar ofertas
+INSERT_CHUNK_SIZE = 500
+
+# Pacing adaptativo AIMD compartido por ambos scrapers (requests por segundo)
+PACER_START_RATE = 0.25
+PACER_MIN_RATE = 0.05
+PACER_MAX_RATE = 2.0
+PACER_INCREASE = 0.05   # aumento aditivo por respuesta sana
+PACER_DECREASE = 0.5    # factor multiplicativo ante 403/429/5xx o latencia creciente
+
+# Checkpoint local para reanudar crawls interrumpidos (--resume)
+CHECKPOINT_PATH = ".cache/crawl_checkpoint.json"
+
+# Si se define, las sesiones de make_session graban cada respuesta aquí (ver replay.py)
+HTTP_RECORD_DIR = None
+
+# Procesos para parsear HTML fuera de los hilos de red (0 = parsear en el mismo hilo)
+PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Archivo local de todo el HTML descargado (comprimido, deduplicado por hash) para re-extraer sin red
+HTML_ARCHIVE_DIR = ".cache/archive"   # None desactiva el archivo
+
+# Casi-duplicados (MinHash + LSH): similitud de Jaccard mínima y forma de la firma
+DEDUP_THRESHOLD = 0.8
+DEDUP_TITLE_THRESHOLD = 0.5  # Jaccard de las palabras del título (sin las de nivel)
+DEDUP_NUM_PERM = 64
+DEDUP_BANDS = 16          # 16 bandas × 4 filas
+
+# Caché negativo de detalles: tras cada fallo se espera BASE × 2^(fallos-1), hasta MAX
+DETAIL_RETRY_BASE = 6 * 3600      # segundos
+DETAIL_RETRY_MAX = 14 * 24 * 3600
+DETAIL_GONE_STATUS = (404, 410)   # la oferta ya no existe: no se reintenta nunca
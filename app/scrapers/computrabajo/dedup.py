@@ -0,0 +1,180 @@
+# app/scrapers/computrabajo/dedup.py
+"""
+Detección de ofertas casi duplicadas (la misma vacante re-publicada con otra URL
+o con un título apenas distinto) con MinHash + LSH por bandas.
+- Cada título + descripción completa se convierte en un conjunto de shingles y en
+  una firma MinHash; la firma se parte en bandas y solo se comparan textos que
+  comparten alguna banda, así la búsqueda no recorre todo el índice.
+- Solo se comparan ofertas de la misma empresa (grupo).
+- Un candidato se confirma si la similitud de Jaccard estimada del texto supera
+  DEDUP_THRESHOLD y la de las palabras del título DEDUP_TITLE_THRESHOLD; un nivel
+  distinto en el título (junior / senior / practicante / líder) lo descarta siempre.
+- La original es siempre la oferta más antigua (fecha de publicación, id).
+"""
+import hashlib
+import re
+import threading
+import unicodedata
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .config import DEDUP_THRESHOLD, DEDUP_TITLE_THRESHOLD, DEDUP_NUM_PERM, DEDUP_BANDS
+from .utils import normalize_text
+
+# Primo de Mersenne 2^31 - 1: a * h + b cabe en uint64 con hashes de 32 bits
+_PRIME = np.uint64((1 << 31) - 1)
+
+_PALABRA = re.compile(r"\w+")
+
+# Palabra del título → nivel: dos títulos con niveles distintos son vacantes distintas
+NIVELES_TITULO = {
+    "junior": "junior", "jr": "junior",
+    "semisenior": "semisenior", "ssr": "semisenior", "semi": "semisenior",
+    "senior": "senior", "sr": "senior",
+    "practicante": "practicante", "pasante": "practicante", "aprendiz": "practicante", "trainee": "practicante",
+    "lider": "lider", "lead": "lider", "jefe": "lider",
+}
+
+
+def _hash32(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def word_shingles(text: str, k: int = 3) -> set:
+    """k-gramas de palabras sobre título + descripción completa."""
+    words = normalize_text(text).split()
+    if len(words) <= k:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+def palabras(texto) -> list:
+    """Palabras sin mayúsculas, tildes ni puntuación."""
+    t = unicodedata.normalize("NFKD", (texto or "").lower())
+    return _PALABRA.findall("".join(c for c in t if not unicodedata.combining(c)))
+
+
+def empresa_clave(empresa) -> str:
+    """Grupo dentro del cual se buscan duplicados."""
+    return " ".join(palabras(empresa))
+
+
+def firma_titulo(titulo) -> tuple:
+    """(palabras del título sin las de nivel, niveles del título)."""
+    tokens = set(palabras(titulo))
+    niveles = frozenset(NIVELES_TITULO[t] for t in tokens if t in NIVELES_TITULO)
+    return frozenset(t for t in tokens if t not in NIVELES_TITULO), niveles
+
+
+def titulos_compatibles(a: tuple, b: tuple, umbral: float = DEDUP_TITLE_THRESHOLD) -> bool:
+    """Mismos niveles y Jaccard de las demás palabras ≥ umbral (firmas de firma_titulo)."""
+    (palabras_a, niveles_a), (palabras_b, niveles_b) = a, b
+    if niveles_a != niveles_b:
+        return False
+    union = palabras_a | palabras_b
+    return not union or len(palabras_a & palabras_b) / len(union) >= umbral
+
+
+def orden_oferta(fecha, oferta_id=None) -> tuple:
+    """Clave de antigüedad (fecha UTC sin zona, id); sin id cuenta como la más nueva de su fecha."""
+    if fecha is None:
+        fecha = datetime.min
+    elif fecha.tzinfo is not None:
+        fecha = fecha.astimezone(timezone.utc).replace(tzinfo=None)
+    return fecha, oferta_id if oferta_id is not None else float("inf")
+
+
+class NearDuplicateIndex:
+    """
+    Índice LSH de firmas MinHash; las claves son las URLs de las ofertas.
+    add(key, text, grupo, titulo, orden) devuelve None (y agrega el texto) o el par
+    (duplicada, original) con la original más antigua según `orden`.
+    """
+
+    def __init__(self, threshold=DEDUP_THRESHOLD, num_perm=DEDUP_NUM_PERM, bands=DEDUP_BANDS,
+                 shingler=word_shingles, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm debe ser múltiplo de bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingler = shingler
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self.signatures = {}
+        self.meta = {}  # key → (grupo, firma_titulo, orden)
+        self.agregadas = 0
+        self.buckets = [dict() for _ in range(bands)]
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def __contains__(self, key):
+        return key in self.signatures
+
+    def signature(self, text: str):
+        """Firma MinHash (uint64[num_perm]); None si el texto no tiene shingles."""
+        shingles = self.shingler(text)
+        if not shingles:
+            return None
+        hashes = np.fromiter((_hash32(s) for s in shingles), dtype=np.uint64, count=len(shingles))
+        return ((np.outer(hashes, self.a) + self.b) % _PRIME).min(axis=0)
+
+    def _band_keys(self, signature):
+        for i in range(self.bands):
+            yield i, signature[i * self.rows:(i + 1) * self.rows].tobytes()
+
+    def _oldest_match(self, signature, grupo, titulo):
+        """La más antigua de las indexadas que son casi-duplicadas del texto, o None."""
+        candidates = set()
+        for i, band in self._band_keys(signature):
+            candidates.update(self.buckets[i].get(band, ()))
+        oldest = None
+        for key in candidates:
+            grupo_key, titulo_key, orden_key = self.meta[key]
+            if grupo_key != grupo or not titulos_compatibles(titulo_key, titulo):
+                continue
+            if float(np.mean(self.signatures[key] == signature)) < self.threshold:
+                continue
+            if oldest is None or orden_key < self.meta[oldest][2]:
+                oldest = key
+        return oldest
+
+    def _insert(self, key, signature, meta):
+        self.signatures[key] = signature
+        self.meta[key] = meta
+        for i, band in self._band_keys(signature):
+            self.buckets[i].setdefault(band, []).append(key)
+
+    def _remove(self, key):
+        signature = self.signatures.pop(key)
+        del self.meta[key]
+        for i, band in self._band_keys(signature):
+            self.buckets[i][band].remove(key)
+
+    def add(self, key, text: str, grupo=None, titulo=None, orden=None):
+        """
+        Si el texto no repite uno indexado, lo agrega y devuelve None. Si lo repite y la
+        indexada es más antigua, devuelve (key, indexada). Si `key` es la más antigua,
+        toma el lugar de la indexada en el índice y devuelve (indexada, key).
+        Sin `orden`, las ofertas cuentan en el orden en que se agregan.
+        """
+        signature = self.signature(text)
+        with self.lock:
+            if signature is None or key in self.signatures:
+                return None
+            self.agregadas += 1
+            meta = (grupo, firma_titulo(titulo), orden if orden is not None else self.agregadas)
+            match = self._oldest_match(signature, grupo, meta[1])
+            if match is None:
+                self._insert(key, signature, meta)
+                return None
+            if self.meta[match][2] <= meta[2]:
+                return key, match
+            self._remove(match)
+            self._insert(key, signature, meta)
+            return match, key
@@ -0,0 +1,121 @@
+# app/scrapers/computrabajo/description_extractor.py
+"""
+Extractor de descripciones en una sola pasada por el DOM.
+Recorre el árbol una vez juntando los candidatos de cada estrategia (p.mbB,
+contenedores con "descripcion" en clase o id, textos "Descripción", párrafos,
+main/article) y después los evalúa en el orden de prioridad original: la primera
+que devuelve texto gana, así el resultado no depende de qué páginas se vieron antes.
+Qué estrategia ganó se devuelve junto al texto para llevar tasas de acierto.
+"""
+import threading
+from collections import Counter
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+# Orden original de extract_description_multi_selector (prioridad para elegir el texto)
+STRATEGIES = ("mbB", "clase_descripcion", "id_descripcion", "encabezado", "parrafo_largo", "main_article")
+
+
+class SelectorStats:
+    """Aciertos por estrategia, solo para reportar tasas (no cambian el orden de evaluación)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = Counter()
+        self.pages = 0
+
+    def record(self, strategy):
+        """strategy None = página sin descripción."""
+        with self.lock:
+            self.pages += 1
+            if strategy:
+                self.hits[strategy] += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "paginas": self.pages,
+                "aciertos": dict(self.hits),
+                "tasa": {s: round(h / self.pages, 3) for s, h in self.hits.items()} if self.pages else {},
+                "sin_descripcion": self.pages - sum(self.hits.values()),
+            }
+
+
+def _text(tag) -> str:
+    return tag.get_text(" ", strip=True) if tag is not None else ""
+
+
+def collect_candidates(soup: BeautifulSoup) -> dict:
+    """Un único recorrido de soup.descendants; no calcula textos todavía."""
+    mbb, paragraphs, headings = [], [], []
+    class_div = id_block = main = article = None
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            name = node.name
+            if name == "p":
+                paragraphs.append(node)
+                if "mbB" in node.get_attribute_list("class"):
+                    mbb.append(node)
+            elif name == "main" and main is None:
+                main = node
+            elif name == "article" and article is None:
+                article = node
+            if name == "div" and class_div is None:
+                if any(c and "descripcion" in c.lower() for c in node.get_attribute_list("class")):
+                    class_div = node
+            if name in ("section", "div") and id_block is None:
+                node_id = node.get("id")
+                if node_id and "descripcion" in node_id.lower():
+                    id_block = node
+        elif isinstance(node, NavigableString) and "descripción" in node.lower():
+            headings.append(node)
+    return {
+        "mbB": mbb,
+        "clase_descripcion": class_div,
+        "id_descripcion": id_block,
+        "encabezado": headings,
+        "parrafo_largo": paragraphs,
+        "main_article": main or article,
+    }
+
+
+def _evaluate(strategy: str, candidate) -> str:
+    if strategy == "mbB":
+        return " ".join(t for t in (_text(p) for p in candidate) if t)
+    if strategy in ("clase_descripcion", "id_descripcion"):
+        return _text(candidate)
+    if strategy == "encabezado":
+        for elem in candidate:
+            sibling = elem.parent.find_next_sibling() if elem.parent else None
+            t = _text(sibling)
+            if t:
+                return t
+        return ""
+    if strategy == "parrafo_largo":
+        for p in candidate:
+            t = _text(p)
+            if len(t) > 120:
+                return t
+        return ""
+    t = _text(candidate)
+    return t if len(t) > 80 else ""
+
+
+def extract_description_single_pass(soup: BeautifulSoup, stats: SelectorStats = None, order=STRATEGIES):
+    """
+    Devuelve (descripcion, estrategia); ("", None) si ninguna estrategia encuentra texto.
+    `stats` (opcional) registra la estrategia ganadora; `order` fija la prioridad y debe
+    ser el mismo en todos los procesos para que el resultado no dependa de cuál parsea.
+    """
+    candidates = collect_candidates(soup)
+    for strategy in order:
+        if not candidates[strategy]:
+            continue
+        text = _evaluate(strategy, candidates[strategy])
+        if text:
+            if stats is not None:
+                stats.record(strategy)
+            return text, strategy
+    if stats is not None:
+        stats.record(None)
+    return "", None
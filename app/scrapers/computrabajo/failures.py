@@ -0,0 +1,70 @@
+# app/scrapers/computrabajo/failures.py
+"""
+Caché negativo de páginas de detalle que fallan.
+Cada URL fallida guarda cuántas veces falló, el último status y desde cuándo se
+puede volver a intentar (espera exponencial). 404/410 quedan como permanentes y
+no se vuelven a pedir. Un éxito borra el registro.
+Las funciones trabajan con db.session: llamarlas dentro de un app_context.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, or_
+
+from app.extensions import db
+from app.models.models import DetalleFallo
+
+from .config import DETAIL_RETRY_BASE, DETAIL_RETRY_MAX, DETAIL_GONE_STATUS
+
+
+def backoff_seconds(fallos: int) -> int:
+    return min(DETAIL_RETRY_MAX, DETAIL_RETRY_BASE * 2 ** max(0, fallos - 1))
+
+
+def filtrar_elegibles(query, url_column, now=None):
+    """Excluye de `query` las URLs permanentes o todavía en espera (outer join por URL)."""
+    now = now or datetime.utcnow()
+    return query.outerjoin(DetalleFallo, DetalleFallo.url == url_column).filter(
+        or_(
+            DetalleFallo.id.is_(None),
+            and_(DetalleFallo.permanente.is_(False), DetalleFallo.proximo_intento <= now),
+        )
+    )
+
+
+def urls_no_elegibles(now=None) -> set:
+    """URLs que filtrar_elegibles excluiría (permanentes o en espera), para filtrar fuera de una query."""
+    now = now or datetime.utcnow()
+    query = db.session.query(DetalleFallo.url).filter(
+        or_(DetalleFallo.permanente.is_(True), DetalleFallo.proximo_intento > now)
+    )
+    return {url for url, in query}
+
+
+def registrar_resultado(url: str, ok: bool, status=None, now=None):
+    """Actualiza (o borra, si ok) el registro de fallos de la URL. No hace commit."""
+    fallo = DetalleFallo.query.filter_by(url=url).first()
+    if ok:
+        if fallo is not None:
+            db.session.delete(fallo)
+        return None
+
+    now = now or datetime.utcnow()
+    if fallo is None:
+        fallo = DetalleFallo(url=url, fallos=0)
+        db.session.add(fallo)
+    fallo.fallos += 1
+    fallo.ultimo_estado = status
+    fallo.ultimo_intento = now
+    fallo.permanente = status in DETAIL_GONE_STATUS
+    fallo.proximo_intento = None if fallo.permanente else now + timedelta(seconds=backoff_seconds(fallo.fallos))
+    return fallo
+
+
+def resumen(now=None) -> dict:
+    """Cuántas URLs están descartadas para siempre y cuántas esperan su próximo intento."""
+    now = now or datetime.utcnow()
+    permanentes = DetalleFallo.query.filter(DetalleFallo.permanente.is_(True)).count()
+    en_espera = DetalleFallo.query.filter(
+        DetalleFallo.permanente.is_(False), DetalleFallo.proximo_intento > now
+    ).count()
+    return {"permanentes": permanentes, "en_espera": en_espera}
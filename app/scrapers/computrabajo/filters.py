@@ -1,5 +1,5 @@
 from .config import BLACKLIST_COMPANIES
-from .utils import within_last_24h, normalize_text
+from .utils import within_last_24h, published_within_last_24h, normalize_text
 
 def apply_filters(ofertas):
     """Aplica filtros de blacklist y fecha de publicación (≤24h)."""
@@ -14,8 +14,12 @@ def apply_filters(ofertas):
                 print(f"[filters] Excluida por blacklist: {empresa}")
                 break
         else:  # solo entra aquí si no se ejecutó el break
-            # filtro fecha
-            if not within_last_24h(fecha):
+            # filtro fecha (exacta si vino datePosted en JSON-LD)
+            if o.get("fecha_publicacion"):
+                reciente = published_within_last_24h(o["fecha_publicacion"])
+            else:
+                reciente = within_last_24h(fecha)
+            if not reciente:
                 print(f"[filters] Excluida por fecha >24h: {fecha}")
                 continue
 
@@ -0,0 +1,156 @@
+# app/scrapers/computrabajo/http_cache.py
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+from .config import HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_MAX_BYTES
+
+
+class HttpCache:
+    """
+    Caché HTTP en disco con GET condicionales.
+    Por cada URL guarda el body (gzip) y un .json con ETag / Last-Modified.
+    Las entradas expiran a los `ttl` segundos y, si el total supera `max_bytes`,
+    se eliminan primero las usadas hace más tiempo.
+    """
+
+    def __init__(self, directory: str = HTTP_CACHE_DIR, ttl: int = HTTP_CACHE_TTL,
+                 max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = 0
+        self.evict()
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".html.gz"
+
+    def _remove(self, meta_path: str, body_path: str, size: int = 0):
+        for p in (meta_path, body_path):
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+        self.total_bytes -= size
+
+    def get(self, url: str):
+        """Devuelve la entrada vigente {body, etag, last_modified, ...} o None."""
+        meta_path, body_path = self._paths(url)
+        with self.lock:
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                with gzip.open(body_path, "rt", encoding="utf-8") as f:
+                    body = f.read()
+            except (OSError, ValueError):
+                return None
+            if time.time() - meta.get("stored_at", 0) > self.ttl:
+                self._remove(meta_path, body_path, meta.get("size", 0))
+                return None
+        meta["body"] = body
+        return meta
+
+    @staticmethod
+    def conditional_headers(entry) -> dict:
+        """Headers If-None-Match / If-Modified-Since para una entrada de get()."""
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, response):
+        """Guarda una respuesta 200 si trae algún validador."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        meta_path, body_path = self._paths(url)
+        data = gzip.compress(response.text.encode("utf-8"))
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "used_at": time.time(),
+            "size": len(data),
+        }
+        with self.lock:
+            previous = self._read_meta(meta_path)
+            if previous:
+                self.total_bytes -= previous.get("size", 0)
+            with open(body_path, "wb") as f:
+                f.write(data)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            self.total_bytes += len(data)
+            over_limit = self.total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def touch(self, url: str):
+        """Tras un 304: la copia sigue siendo válida, se renueva su vigencia."""
+        meta_path, _ = self._paths(url)
+        with self.lock:
+            meta = self._read_meta(meta_path)
+            if not meta:
+                return
+            meta["stored_at"] = meta["used_at"] = time.time()
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+
+    @staticmethod
+    def _read_meta(meta_path: str):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def evict(self):
+        """Elimina entradas vencidas y, si hace falta, las menos usadas hasta cumplir max_bytes."""
+        with self.lock:
+            now = time.time()
+            entries = []
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(self.directory, name)
+                body_path = meta_path[:-len(".json")] + ".html.gz"
+                meta = self._read_meta(meta_path)
+                if not meta or now - meta.get("stored_at", 0) > self.ttl:
+                    self._remove(meta_path, body_path)
+                    continue
+                entries.append((meta.get("used_at", 0), meta.get("size", 0), meta_path, body_path))
+
+            total = sum(e[1] for e in entries)
+            entries.sort()
+            for _, size, meta_path, body_path in entries:
+                if total <= self.max_bytes:
+                    break
+                self._remove(meta_path, body_path)
+                total -= size
+            self.total_bytes = total
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> HttpCache:
+    """Caché compartida por el scraper de listados y el de detalle."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
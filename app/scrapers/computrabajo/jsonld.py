@@ -0,0 +1,124 @@
+# app/scrapers/computrabajo/jsonld.py
+"""
+Extracción rápida de ofertas desde bloques <script type="application/ld+json">.
+Trabaja sobre el HTML crudo con expresiones regulares: no construye el DOM.
+"""
+import html as html_lib
+import json
+import re
+from urllib.parse import urljoin
+
+LD_JSON_RE = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+TAG_RE = re.compile(r"<[^>]+>")
+BLOCK_TAG_RE = re.compile(r"<\s*(br|/p|/li|/div|/h\d)\s*/?>", re.IGNORECASE)
+
+
+def html_to_text(fragment: str) -> str:
+    """
+    Quita entidades y etiquetas HTML, normalizando espacios. Las entidades van primero:
+    muchas descripciones vienen con las etiquetas escapadas (&lt;p&gt;...).
+    """
+    if not fragment:
+        return ""
+    text = html_lib.unescape(fragment)
+    text = BLOCK_TAG_RE.sub(" ", text)
+    text = TAG_RE.sub(" ", text)
+    return " ".join(text.split())
+
+
+def _is_jobposting(item) -> bool:
+    t = item.get("@type", "")
+    types = t if isinstance(t, list) else [t]
+    return any(isinstance(x, str) and x.lower() == "jobposting" for x in types)
+
+
+def _walk(payload):
+    """Recorre dicts/listas JSON-LD incluyendo @graph e ItemList → item."""
+    if isinstance(payload, list):
+        for p in payload:
+            yield from _walk(p)
+    elif isinstance(payload, dict):
+        yield payload
+        if "@graph" in payload:
+            yield from _walk(payload["@graph"])
+        for element in payload.get("itemListElement", []) or []:
+            if isinstance(element, dict) and "item" in element:
+                yield from _walk(element["item"])
+            else:
+                yield from _walk(element)
+
+
+def extract_jobpostings(html: str) -> list:
+    """Devuelve todos los objetos JobPosting presentes en los bloques ld+json."""
+    items = []
+    for raw in LD_JSON_RE.findall(html or ""):
+        try:
+            payload = json.loads(raw.strip() or "{}")
+        except ValueError:
+            continue
+        items.extend(i for i in _walk(payload) if _is_jobposting(i))
+    return items
+
+
+def _name(value) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        return value.get("name") or ""
+    return value or ""
+
+
+def _location(value) -> str:
+    if isinstance(value, list):
+        return ", ".join(filter(None, (_location(v) for v in value)))
+    if not isinstance(value, dict):
+        return value or ""
+    address = value.get("address", value)
+    if isinstance(address, list):
+        return _location(address)
+    if isinstance(address, str):
+        return address
+    parts = [address.get("addressLocality"), address.get("addressRegion")]
+    return ", ".join(p for p in parts if p)
+
+
+def jobposting_to_offer(item: dict, base_url: str) -> dict:
+    """Convierte un JobPosting al mismo dict que produce parse_offers_from_soup."""
+    url = item.get("url")
+    date_posted = item.get("datePosted")
+    descripcion = html_to_text(item.get("description", ""))
+    return {
+        "titulo": html_to_text(item.get("title", "")) or "N/A",
+        "empresa": _name(item.get("hiringOrganization")) or "N/A",
+        "ubicacion": _location(item.get("jobLocation")) or "N/A",
+        "raw_fecha": date_posted,
+        "fecha_publicacion": date_posted,  # ISO 8601 exacto
+        "url": urljoin(base_url, url) if url else None,
+        "descripcion": descripcion or "Oferta oculta",
+        "fuente": "Computrabajo",
+    }
+
+
+def offers_from_jsonld(html: str, base_url: str, max_to_take: int = 50) -> list:
+    """Ofertas de una página de listado; lista vacía si no hay JobPosting con URL."""
+    ofertas = []
+    for item in extract_jobpostings(html):
+        oferta = jobposting_to_offer(item, base_url)
+        if not oferta["url"]:
+            continue
+        ofertas.append(oferta)
+        if len(ofertas) >= max_to_take:
+            break
+    return ofertas
+
+
+def description_from_jsonld(html: str) -> str:
+    """Descripción de una página de detalle; cadena vacía si no hay JobPosting."""
+    for item in extract_jobpostings(html):
+        text = html_to_text(item.get("description", ""))
+        if text:
+            return text
+    return ""
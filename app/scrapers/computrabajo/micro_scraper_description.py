@@ -1,7 +1,9 @@
 # app/scrapers/computrabajo/micro_scraper_description.py
 import random
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple, Optional
 
 import requests
 from bs4 import BeautifulSoup
@@ -13,7 +15,19 @@ from app.extensions import db
 from app.models import Oferta
 
 # Import main scraper (wrapper) para mantener compatibilidad con tu runflow
-from .scraper import main as run_main_scraper
+from .scraper import main as run_main_scraper, guardar_duplicados
+from .config import DETAIL_WORKERS, DETAIL_RATE, DETAIL_BURST, HTTP_RECORD_DIR, DETAIL_GONE_STATUS
+from .utils import es_placeholder
+from .rate_limiter import HostRateLimiter
+from .pacing import get_pacer
+from .http_cache import HttpCache, get_default_cache
+from .archive import HtmlArchive, get_default_archive
+from .jsonld import description_from_jsonld
+from .description_extractor import SelectorStats, extract_description_single_pass
+from .failures import filtrar_elegibles, registrar_resultado, resumen as resumen_fallos
+from .dedup import NearDuplicateIndex, empresa_clave, orden_oferta
+from .replay import record_session
+from .parsing import ParsePool, get_parse_pool, parse_detail_html, response_bytes
 
 # User agents (mismos que en scraper.py o una lista similar)
 USER_AGENTS = [
@@ -33,7 +47,7 @@ HEADERS_BASE = {
 }
 
 
-def make_session():
+def make_session(pool_size: int = 10):
     session = requests.Session()
     retry_strategy = Retry(
         total=3,
@@ -41,9 +55,12 @@ def make_session():
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["GET", "HEAD"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # pool_maxsize >= workers para que los hilos no esperen conexión libre
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
+    if HTTP_RECORD_DIR:
+        record_session(session, HTTP_RECORD_DIR)
     return session
 
 
@@ -58,39 +75,79 @@ def get_random_headers(request_count: int, referer: str = None):
 
 
 def smart_delay_description(request_count: int):
-    """Delay más conservador para requests a páginas de detalle."""
-    base = random.uniform(3, 8)
-    if request_count > 10:
-        base += random.uniform(2, 5)
-    if request_count % 5 == 0 and request_count != 0:
-        base += random.uniform(10, 25)
-    print(f"[detail] Durmiendo {base:.2f}s (request #{request_count})")
-    time.sleep(base)
+    """Pausa entre requests a páginas de detalle, decidida por el pacer AIMD compartido."""
+    get_pacer().wait("detail", request_count)
+
+
+class DetailResult(NamedTuple):
+    """Resultado de una descarga de detalle."""
+    descripcion: str
+    ok: bool
+    status: Optional[int] = None  # último HTTP status; None si fue error de red/timeout
 
 
 class DescriptionScraper:
     """Clase para manejar requests a páginas de detalle con estrategia anti-bloqueo."""
 
-    def __init__(self):
-        self.session = make_session()
+    def __init__(self, rate_limiter: Optional[HostRateLimiter] = None, workers: int = 1,
+                 cache: Optional[HttpCache] = None, parser: Optional[ParsePool] = None,
+                 archive: Optional[HtmlArchive] = None):
+        """
+        - rate_limiter: si se pasa, reemplaza smart_delay_description por un token bucket por host
+        - workers: requests en vuelo al usar fetch_many
+        - cache: HttpCache para GET condicionales (304 → copia guardada)
+        - parser: pool de procesos para extraer la descripción (por defecto el compartido)
+        - archive: HtmlArchive donde guardar cada página de detalle descargada
+        """
+        self.archive = archive
+        # Estrategia ganadora de cada página (los procesos del pool devuelven el nombre)
+        self.selector_stats = SelectorStats()
+        self.parser = parser or get_parse_pool()
+        self.session = make_session(pool_size=max(10, workers))
         self.request_count = 0
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.workers = workers
+        self.lock = threading.Lock()
+
+    def _count_request(self) -> int:
+        with self.lock:
+            self.request_count += 1
+            return self.request_count
 
     def fetch_offer_detail(self, url: str, max_retries: int = 3) -> str:
         """
         Intenta obtener la descripción completa de la oferta.
         Devuelve una cadena con la descripción o un placeholder si falla.
         """
+        return self.fetch_detail(url, max_retries).descripcion
+
+    def fetch_detail(self, url: str, max_retries: int = 3) -> DetailResult:
+        """
+        Como fetch_offer_detail pero con el estado de la descarga (para el caché negativo).
+        404/410 no se reintentan: la oferta ya no existe.
+        """
         last_exc = None
+        last_status = None
         for attempt in range(1, max_retries + 1):
             try:
-                if self.request_count > 0:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(url)
+                elif self.request_count > 0:
                     smart_delay_description(self.request_count)
 
-                headers = get_random_headers(self.request_count, referer="https://www.computrabajo.com.co/")
-                print(f"[detail] Request #{self.request_count + 1} -> {url} (attempt {attempt})")
+                request_n = self._count_request()
+                headers = get_random_headers(request_n, referer="https://www.computrabajo.com.co/")
+                cached = self.cache.get(url) if self.cache is not None else None
+                headers.update(HttpCache.conditional_headers(cached))
+                print(f"[detail] Request #{request_n} -> {url} (attempt {attempt})")
                 resp = self.session.get(url, headers=headers, timeout=25)
-                status = resp.status_code
-                self.request_count += 1
+                status = last_status = resp.status_code
+                get_pacer().record(status, resp.elapsed.total_seconds())
+
+                if status in DETAIL_GONE_STATUS:
+                    print(f"[detail] {status} en detalle: la oferta ya no existe ({url})")
+                    return DetailResult(f"Descripción no disponible ({status})", False, status)
 
                 if status == 403:
                     print(f"[detail] 403 en detalle (attempt {attempt}) para {url}")
@@ -101,19 +158,36 @@ class DescriptionScraper:
                         last_exc = Exception("403")
                         continue
                     else:
-                        return "Descripción no disponible (403)"
+                        return DetailResult("Descripción no disponible (403)", False, status)
 
-                resp.raise_for_status()
-
-                soup = BeautifulSoup(resp.text, "html.parser")
-                description = self.extract_description_multi_selector(soup)
+                if status == 304 and cached:
+                    print(f"[detail] 304 Not Modified, usando caché para {url}")
+                    self.cache.touch(url)
+                    html = cached["body"]
+                else:
+                    resp.raise_for_status()
+                    if self.cache is not None:
+                        self.cache.store(url, resp)
+                    html = response_bytes(resp)
+                    if self.archive is not None:
+                        self.archive.put(url, html, "detail")
+
+                # El parseo va al pool de procesos; este hilo solo espera el resultado
+                parsed = self.parser.run(parse_detail_html, html)
+                self.selector_stats.record(parsed["strategy"])
+                description = parsed["description"]
                 if description and "acceso denegado" in description.lower():
                     # Página dice que no hay acceso
-                    return "Descripción no disponible (acceso denegado)"
-                return description or "Descripción no disponible"
+                    return DetailResult("Descripción no disponible (acceso denegado)", False, status)
+                if not description:
+                    return DetailResult("Descripción no disponible", False, status)
+                return DetailResult(description, True, status)
 
             except requests.exceptions.RequestException as e:
                 print(f"[detail] Error request attempt {attempt} para {url}: {e}")
+                if not isinstance(e, requests.exceptions.HTTPError):
+                    get_pacer().record(None)
+                    last_status = None
                 last_exc = e
                 if attempt < max_retries:
                     time.sleep(random.uniform(5, 12) * attempt)
@@ -122,13 +196,49 @@ class DescriptionScraper:
 
         # Si fallaron todos los intentos
         if last_exc:
-            return f"Descripción no disponible (error: {str(last_exc)})"
-        return "Descripción no disponible (max retries)"
+            return DetailResult(f"Descripción no disponible (error: {str(last_exc)})", False, last_status)
+        return DetailResult("Descripción no disponible (max retries)", False, last_status)
+
+    def fetch_many(self, urls):
+        """
+        Descarga varias ofertas en paralelo (self.workers requests en vuelo) y
+        genera tuplas (url, DetailResult) a medida que terminan.
+        Si una descarga lanza una excepción inesperada, el resultado es None.
+        """
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = {pool.submit(self.fetch_detail, url): url for url in urls}
+            for fut in as_completed(futures):
+                url = futures[fut]
+                try:
+                    yield url, fut.result()
+                except Exception as e:
+                    print(f"[detail] Error inesperado para {url}: {e}")
+                    yield url, None
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    def extract_description(cls, html: str) -> str:
+        return cls.extract_description_with_strategy(html)[0]
+
+    @staticmethod
+    def extract_description_with_strategy(html: str):
+        """
+        Devuelve (descripcion, estrategia): desde el JobPosting JSON-LD si existe
+        (sin construir el DOM); si no, con el extractor de una sola pasada.
+        """
+        description = description_from_jsonld(html)
+        if description:
+            return description, "jsonld"
+        return extract_description_single_pass(BeautifulSoup(html, "html.parser"))
 
     @staticmethod
     def extract_description_multi_selector(soup: BeautifulSoup) -> str:
         """
         Intenta múltiples selectores y fallbacks para extraer la descripción.
+        Versión original (un recorrido del árbol por selector); extract_description
+        usa extract_description_single_pass, que devuelve lo mismo en una pasada.
         """
         # Selector principal conocido en Computrabajo
         p_tags = soup.find_all("p", class_="mbB")
@@ -179,70 +289,121 @@ class DescriptionScraper:
         return ""
 
 
+def load_description_index():
+    """
+    Índice de casi-duplicados por título + descripción completa de las ofertas
+    originales que ya la tienen. Devuelve (índice, {url: id}). Requiere app_context.
+    """
+    index = NearDuplicateIndex()
+    ids = {}
+    query = (db.session.query(Oferta.id, Oferta.url, Oferta.titulo, Oferta.empresa, Oferta.descripcion,
+                              Oferta.fecha_publicacion)
+             .filter(Oferta.descripcion_estado == Oferta.DESC_OBTENIDA, Oferta.duplicado_de.is_(None))
+             .yield_per(5000))
+    for oferta_id, url, titulo, empresa, descripcion, fecha in query:
+        if url:
+            index.add(url, f"{titulo} {descripcion}", empresa_clave(empresa), titulo, orden_oferta(fecha, oferta_id))
+            ids[url] = oferta_id
+    return index, ids
+
+
 def update_missing_descriptions():
     """
-    Encuentra en la DB ofertas con descripción placeholder y las actualiza con la
-    DescriptionScraper. Hace commits parciales para evitar pérdida.
+    Encuentra en la DB ofertas con descripción pendiente o fallida (descripcion_estado)
+    y las actualiza con la DescriptionScraper. Hace commits parciales para evitar pérdida:
+    la columna descripcion_estado es la cola, así que una corrida interrumpida se retoma
+    simplemente volviendo a correr (no hace falta checkpoint).
+    Las ofertas marcadas como casi-duplicadas no se descargan; si una descripción
+    recién obtenida repite la de otra oferta de la misma empresa, la más nueva de las
+    dos queda como duplicada de la más antigua.
+    Las URLs que fallaron antes solo se reintentan tras su espera (caché negativo,
+    ver failures.py) y las que dieron 404/410 no se vuelven a pedir.
     """
     app = create_app()
     with app.app_context():
-        offers = Oferta.query.filter(
-            (Oferta.descripcion == None)
-            | (Oferta.descripcion == "Descripción no disponible")
-            | (Oferta.descripcion == "Oferta oculta")
-            | (Oferta.descripcion.like("Descripción no disponible%"))
+        offers = filtrar_elegibles(Oferta.query, Oferta.url).filter(
+            Oferta.descripcion_estado.in_((Oferta.DESC_PENDIENTE, Oferta.DESC_FALLIDA)),
+            Oferta.duplicado_de.is_(None),
         ).all()
+        print(f"[update_missing_descriptions] Omitidas por fallos previos: {resumen_fallos()}")
 
         print(f"[update_missing_descriptions] Ofertas a actualizar: {len(offers)}")
         if not offers:
             print("[update_missing_descriptions] Nada para actualizar.")
             return
 
-        scraper = DescriptionScraper()
+        # N requests en vuelo bajo un único token bucket por host: el tiempo total
+        # depende de DETAIL_RATE y no de la suma de pausas en serie.
+        pacer = get_pacer()
+        pacer.reset_stats()
+        scraper = DescriptionScraper(
+            rate_limiter=HostRateLimiter(DETAIL_RATE, DETAIL_BURST, pacer=pacer),
+            workers=DETAIL_WORKERS,
+            cache=get_default_cache(),
+            archive=get_default_archive()
+        )
+        offers_by_url = {o.url: o for o in offers if o.url}
         updated = 0
-        errors = 0
+        duplicadas = 0
+        errors = len(offers) - len(offers_by_url)
+        index, ids = load_description_index()
 
-        for i, o in enumerate(offers, start=1):
+        for i, (url, result) in enumerate(scraper.fetch_many(list(offers_by_url)), start=1):
+            o = offers_by_url[url]
             try:
-                print(f"[update_missing_descriptions] ({i}/{len(offers)}) fetch {o.url}")
-                desc = scraper.fetch_offer_detail(o.url)
+                print(f"[update_missing_descriptions] ({i}/{len(offers_by_url)}) recibida {url}")
+                ok = result is not None and result.ok
+                status = result.status if result is not None else None
+                registrar_resultado(url, ok, status)
+                desc = result.descripcion if ok else None
                 # Guardar solo si obtenemos algo útil
-                if desc and desc not in ["Descripción no disponible", "Oferta oculta"]:
+                if desc and not es_placeholder(desc):
                     o.descripcion = desc
+                    o.descripcion_estado = Oferta.DESC_OBTENIDA
+                    par = index.add(url, f"{o.titulo} {desc}", empresa_clave(o.empresa), o.titulo,
+                                    orden_oferta(o.fecha_publicacion, o.id))
+                    if par is not None and par[0] == url:
+                        o.duplicado_de = ids[par[1]]
+                        duplicadas += 1
+                    else:
+                        ids[url] = o.id
+                        if par is not None:
+                            # Esta es más antigua: la que estaba indexada pasa a ser su duplicada
+                            guardar_duplicados([par])
+                            duplicadas += 1
                     db.session.add(o)
                     updated += 1
 
-                    # Commit cada 10 actualizaciones (checkpoint)
-                    if updated % 10 == 0:
-                        db.session.commit()
-                        print(f"[update_missing_descriptions] Checkpoint: {updated} actualizadas")
-
                 else:
                     errors += 1
-                    print(f"[update_missing_descriptions] No se obtuvo descripción útil para {o.url}")
-
-                # Pausa extra cada 20 requests para mayor conservadurismo
-                if i % 20 == 0:
-                    extra = random.uniform(30, 60)
-                    print(f"[update_missing_descriptions] Pausa extra de {extra:.1f}s...")
-                    time.sleep(extra)
+                    o.descripcion_estado = Oferta.DESC_ELIMINADA if status in DETAIL_GONE_STATUS else Oferta.DESC_FALLIDA
+                    db.session.add(o)
+                    print(f"[update_missing_descriptions] No se obtuvo descripción útil para {url}")
 
             except Exception as e:
                 errors += 1
                 print(f"[update_missing_descriptions] Error actualizando oferta {getattr(o, 'id', 'n/a')}: {e}")
-                continue
+
+            # Commit cada 10 resultados
+            if i % 10 == 0:
+                db.session.commit()
+                print(f"[update_missing_descriptions] Commit: {updated} actualizadas, "
+                      f"{len(offers_by_url) - i} pendientes")
 
         db.session.commit()
         print("[update_missing_descriptions] ✅ Actualización completada.")
         print(f"  - Actualizadas: {updated}")
+        print(f"  - Casi-duplicadas: {duplicadas}")
         print(f"  - Errores: {errors}")
         print(f"  - Total requests: {scraper.request_count}")
+        print(f"  - Pacing: {pacer.stats()}")
+        print(f"  - Selectores: {scraper.selector_stats.snapshot()}")
 
 
 # Compatibilidad con run_scraper.py (API pública)
-def get_offers():
+def get_offers(resume=False):
     """Ejecuta el scraper principal (lista) y guarda en DB"""
-    run_main_scraper()
+    run_main_scraper(resume=resume)
     return None
 
 
@@ -0,0 +1,122 @@
+# app/scrapers/computrabajo/pacing.py
+import random
+import threading
+import time
+import weakref
+
+from .config import PACER_START_RATE, PACER_MIN_RATE, PACER_MAX_RATE, PACER_INCREASE, PACER_DECREASE
+
+BACKOFF_STATUS = {403, 429}
+
+
+class AdaptivePacer:
+    """
+    Control AIMD de la tasa de requests (requests por segundo).
+    - Respuesta sana: la tasa sube en `increase` (aumento aditivo).
+    - 403/429/5xx, error de red o latencia > `latency_factor` × la latencia base:
+      la tasa se multiplica por `decrease` (como mucho una vez por `cooldown`).
+    La tasa se propaga a los TokenBucket enganchados con attach(), respetando
+    la tasa que tenía cada uno como techo.
+    """
+
+    def __init__(self, rate=PACER_START_RATE, min_rate=PACER_MIN_RATE, max_rate=PACER_MAX_RATE,
+                 increase=PACER_INCREASE, decrease=PACER_DECREASE, latency_factor=2.0, cooldown=5.0):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.lock = threading.Lock()
+        # bucket → techo; débil para no retener buckets de corridas anteriores
+        self.buckets = weakref.WeakKeyDictionary()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reinicia las estadísticas (una vez por corrida)."""
+        with self.lock:
+            self.latency_ewma = None
+            self.latency_base = None
+            self.last_decrease = 0.0
+            self.requests = 0
+            self.backoffs = 0
+            self.rate_sum = 0.0
+            self.rate_min = self.rate
+            self.rate_max = self.rate
+
+    def attach(self, bucket):
+        """Engancha un TokenBucket: su tasa actual queda como techo."""
+        with self.lock:
+            self.buckets[bucket] = bucket.rate
+            bucket.rate = min(self.rate, bucket.rate)
+
+    def delay(self) -> float:
+        """Pausa sugerida para el modo en serie (con un poco de jitter)."""
+        return random.uniform(0.8, 1.2) / self.rate
+
+    def wait(self, tag="scraper", request_count=None):
+        delay = self.delay()
+        suffix = f" (request #{request_count})" if request_count is not None else ""
+        print(f"[{tag}] Durmiendo {delay:.2f}s a {self.rate:.2f} req/s{suffix}")
+        time.sleep(delay)
+
+    def record(self, status=None, elapsed=None):
+        """
+        Registra el resultado de un request.
+        status None significa error de red/timeout; elapsed en segundos.
+        """
+        with self.lock:
+            self.requests += 1
+            backoff = status is None or status in BACKOFF_STATUS or status >= 500
+
+            if elapsed is not None and not backoff:
+                self.latency_ewma = elapsed if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * elapsed
+                if self.requests >= 3:
+                    if self.latency_base is None or self.latency_ewma < self.latency_base:
+                        self.latency_base = self.latency_ewma
+                    elif self.latency_ewma > self.latency_base * self.latency_factor:
+                        # retrocede una vez y toma la latencia actual como nueva referencia
+                        backoff = True
+                        self.latency_base = self.latency_ewma
+
+            now = time.monotonic()
+            if backoff:
+                if now - self.last_decrease >= self.cooldown:
+                    self.rate = max(self.min_rate, self.rate * self.decrease)
+                    self.last_decrease = now
+                    self.backoffs += 1
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+            for bucket, ceiling in list(self.buckets.items()):
+                bucket.rate = min(self.rate, ceiling)
+
+            self.rate_sum += self.rate
+            self.rate_min = min(self.rate_min, self.rate)
+            self.rate_max = max(self.rate_max, self.rate)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "backoffs": self.backoffs,
+                "rate_actual": round(self.rate, 3),
+                "rate_min": round(self.rate_min, 3),
+                "rate_max": round(self.rate_max, 3),
+                "rate_promedio": round(self.rate_sum / self.requests, 3) if self.requests else None,
+                "latencia_ewma": round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+            }
+
+
+_default_pacer = None
+_default_lock = threading.Lock()
+
+
+def get_pacer() -> AdaptivePacer:
+    """Pacer compartido por el scraper de listados y el de detalle."""
+    global _default_pacer
+    with _default_lock:
+        if _default_pacer is None:
+            _default_pacer = AdaptivePacer()
+        return _default_pacer
@@ -0,0 +1,65 @@
+# app/scrapers/computrabajo/parsing.py
+"""
+Parseo de HTML en un pool de procesos, separado de la E/S de red.
+Las funciones de trabajo son de nivel de módulo (picklables): reciben el HTML
+crudo (bytes UTF-8, o str si viene de la caché) y devuelven dicts/strings simples.
+Así los hilos de descarga siguen pidiendo páginas mientras otros núcleos parsean.
+"""
+import atexit
+import threading
+
+from app.process_pool import ProcessPool
+from .config import PARSE_WORKERS
+
+
+def to_text(raw) -> str:
+    if isinstance(raw, bytes):
+        return raw.decode("utf-8", errors="replace")
+    return raw or ""
+
+
+def response_bytes(resp) -> bytes:
+    """Body en UTF-8 sin decodificar en el hilo de red cuando ya viene en UTF-8."""
+    encoding = (resp.encoding or "").lower().replace("_", "-")
+    if encoding in ("utf-8", "utf8"):
+        return resp.content
+    return resp.text.encode("utf-8")
+
+
+def parse_list_html(raw, max_to_take=50) -> dict:
+    """Página de listado → {"offers": [...], "next_url": str | None}."""
+    from .scraper import parse_list_page
+    offers, next_url = parse_list_page(to_text(raw), max_to_take=max_to_take)
+    return {"offers": offers, "next_url": next_url}
+
+
+def parse_detail_html(raw) -> dict:
+    """Página de detalle → {"description": str ("" si no hay), "strategy": str | None}."""
+    from .micro_scraper_description import DescriptionScraper
+    description, strategy = DescriptionScraper.extract_description_with_strategy(to_text(raw))
+    return {"description": description, "strategy": strategy}
+
+
+class ParsePool(ProcessPool):
+    """
+    Pool de parseo: PARSE_WORKERS procesos por defecto, creados con "spawn": el pool se
+    crea de forma perezosa desde hilos de descarga, con sesiones HTTP y el engine de la
+    DB vivos, y un fork copiaría ese estado a medio usar.
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS):
+        super().__init__(workers, start_method="spawn")
+
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def get_parse_pool() -> ParsePool:
+    """Pool compartido por el scraper de listados y el de detalle."""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = ParsePool()
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
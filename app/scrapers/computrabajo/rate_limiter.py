@@ -0,0 +1,63 @@
+# app/scrapers/computrabajo/rate_limiter.py
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe.
+    - rate: tokens por segundo que se reponen
+    - capacity: ráfaga máxima permitida
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Bloquea hasta tener `tokens` disponibles. Devuelve el tiempo esperado."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """Un TokenBucket por host, compartido por todos los hilos que hacen requests."""
+
+    def __init__(self, rate: float, capacity: float = 1, pacer=None):
+        """pacer: AdaptivePacer opcional que ajusta la tasa de cada bucket (rate queda como techo)."""
+        self.rate = rate
+        self.capacity = capacity
+        self.pacer = pacer
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity)
+                if self.pacer is not None:
+                    self.pacer.attach(bucket)
+                self.buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        return self.bucket_for(url).acquire()
@@ -0,0 +1,149 @@
+# app/scrapers/computrabajo/replay.py
+"""
+Grabación y reproducción de respuestas HTTP para medir los scrapers sin red.
+- record_session(session, dir): la sesión de make_session guarda cada respuesta
+- replay_session(dir): sesión que responde solo desde las grabaciones
+- serve_recordings(dir): servidor HTTP local que sirve las páginas grabadas
+"""
+import hashlib
+import http.server
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+SAVED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def path_key(url: str) -> str:
+    """Ruta + query, sin host: así el servidor local atiende URLs reescritas."""
+    parts = urlsplit(url)
+    return parts.path + ("?" + parts.query if parts.query else "")
+
+
+def save_recording(directory: str, url: str, status: int, headers, body: bytes):
+    os.makedirs(directory, exist_ok=True)
+    key = _key(url)
+    with open(os.path.join(directory, key + ".body"), "wb") as f:
+        f.write(body)
+    meta = {
+        "url": url,
+        "status": status,
+        "headers": {h: headers[h] for h in SAVED_HEADERS if h in headers},
+    }
+    with open(os.path.join(directory, key + ".json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+def load_recordings(directory: str) -> list:
+    """Lista de (meta, body) de todas las grabaciones del directorio."""
+    recordings = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(os.path.join(directory, name[:-len(".json")] + ".body"), "rb") as f:
+            recordings.append((meta, f.read()))
+    return recordings
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTPAdapter que además guarda cada respuesta GET exitosa en `directory`."""
+
+    def __init__(self, directory: str, **kwargs):
+        self.directory = directory
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if request.method == "GET" and response.status_code == 200:
+            save_recording(self.directory, request.url, response.status_code,
+                           response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Adapter que responde desde las grabaciones (404 si la URL no fue grabada)."""
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        key = _key(request.url)
+        try:
+            with open(os.path.join(self.directory, key + ".json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(os.path.join(self.directory, key + ".body"), "rb") as f:
+                response._content = f.read()
+            response.status_code = meta["status"]
+            response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        except OSError:
+            response.status_code = 404
+            response._content = b""
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+def record_session(session: requests.Session, directory: str) -> requests.Session:
+    """Monta un RecordingAdapter conservando la política de reintentos de la sesión."""
+    retries = session.get_adapter("https://").max_retries
+    adapter = RecordingAdapter(directory, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def replay_session(directory: str) -> requests.Session:
+    session = requests.Session()
+    adapter = ReplayAdapter(directory)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def serve_recordings(directory: str, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+    """
+    Levanta en un hilo un servidor HTTP que sirve las grabaciones por ruta+query.
+    `latency` (segundos) simula el tiempo de respuesta del sitio real.
+    Devuelve el servidor; su URL base es f"http://{host}:{server.server_port}".
+    """
+    pages = {path_key(meta["url"]): (meta, body) for meta, body in load_recordings(directory)}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            meta, body = pages.get(self.path, (None, None))
+            if meta is None:
+                self.send_error(404)
+                return
+            self.send_response(meta["status"])
+            for h, v in meta.get("headers", {}).items():
+                self.send_header(h, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -1,17 +1,33 @@
 # app/scrapers/computrabajo/scraper.py
+import html as html_lib
 import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timezone
 from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
+from sqlalchemy import update
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .config import LOCATION, MAX_RESULTS, MAX_PAGES, REQUEST_DELAY
-from .utils import parse_hace_to_timedelta, title_is_duplicate
+from .config import (
+    LOCATION, MAX_RESULTS, MAX_PAGES,
+    CRAWL_WORKERS, CRAWL_RPM, CRAWL_BURST, INCREMENTAL, INCREMENTAL_STOP_PAGES,
+    INSERT_CHUNK_SIZE, HTTP_RECORD_DIR
+)
+from .checkpoint import CrawlCheckpoint
+from .replay import record_session
+from .utils import parse_hace_to_timedelta, parse_iso_datetime, title_is_duplicate, es_placeholder, UrlSet
 from .filters import apply_filters
+from .http_cache import HttpCache, get_default_cache
+from .archive import HtmlArchive, get_default_archive
+from .rate_limiter import TokenBucket
+from .pacing import get_pacer
+from .jsonld import offers_from_jsonld, html_to_text
+from .parsing import ParsePool, get_parse_pool, parse_list_html, response_bytes
 
 from app import create_app
 from app.extensions import db
@@ -48,7 +64,7 @@ SEARCH_TERMS = [
 ]
 
 
-def make_session():
+def make_session(pool_size: int = 10):
     """Crea sesión requests con reintentos para errores transitorios."""
     session = requests.Session()
     retry_strategy = Retry(
@@ -57,10 +73,12 @@ def make_session():
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["GET", "HEAD"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     # No establecer User-Agent aquí: lo ponemos por request para rotarlo.
+    if HTTP_RECORD_DIR:
+        record_session(session, HTTP_RECORD_DIR)
     return session
 
 
@@ -85,29 +103,16 @@ def get_random_headers(request_count: int, referer: str = None):
 
 def smart_delay(request_count: int, base_range=None):
     """
-    Delay 'humano' y progresivo.
-    - base_range: tuple(min,max) en segundos (si None, derivado de REQUEST_DELAY)
+    Pausa entre requests del listado.
+    - Sin base_range la decide el pacer AIMD compartido (se acorta mientras el
+      servidor responde bien y retrocede ante 403/429/5xx o latencia creciente).
+    - base_range: tuple(min,max) en segundos fuerza una pausa aleatoria fija.
     """
     if base_range is None:
-        try:
-            base_range = (max(1, REQUEST_DELAY[0] * 1.5), max(2, REQUEST_DELAY[1] * 1.5))
-        except Exception:
-            base_range = (3, 8)
+        get_pacer().wait("scraper", request_count)
+        return
 
     delay = random.uniform(base_range[0], base_range[1])
-
-    # incrementar delays después de muchas requests
-    if request_count > 40:
-        delay += random.uniform(4, 8)
-    elif request_count > 20:
-        delay += random.uniform(2, 5)
-
-    # cada 10 requests, hay una pausa más larga (simula que la persona revisa otros resultados)
-    if request_count % 10 == 0 and request_count != 0:
-        extra = random.uniform(15, 40)
-        print(f"[scraper] Checkpoint pause extra de {extra:.1f}s (request #{request_count})")
-        delay += extra
-
     print(f"[scraper] Durmiendo {delay:.2f}s (request #{request_count})")
     time.sleep(delay)
 
@@ -125,21 +130,36 @@ def build_search_url(term, location=LOCATION, page=None):
     return base
 
 
-def fetch_page(session: requests.Session, url: str, request_count: int, max_retries: int = 3):
+def fetch_page(session: requests.Session, url: str, request_count: int, max_retries: int = 3, cache=None,
+               budget: TokenBucket = None, raw: bool = False, archive: HtmlArchive = None):
     """
     Obtiene HTML de la página con manejo de 403 y reintentos adaptativos.
+    Si se pasa `cache` (HttpCache) hace GET condicional y un 304 devuelve la copia guardada.
+    Si se pasa `budget` (TokenBucket global) cada intento consume un token en lugar de smart_delay.
+    Con raw=True devuelve el body en bytes UTF-8 (para parsearlo en otro proceso).
+    Si se pasa `archive` (HtmlArchive) cada respuesta 200 queda archivada como "list".
     Lanza Exception si no puede recuperarse.
     """
     last_exc = None
     for attempt in range(1, max_retries + 1):
         try:
-            if request_count > 0:
+            if budget is not None:
+                budget.acquire()
+            elif request_count > 0:
                 smart_delay(request_count)
 
             headers = get_random_headers(request_count, referer=BASE_URL)
+            cached = cache.get(url) if cache is not None else None
+            headers.update(HttpCache.conditional_headers(cached))
             print(f"[scraper] Request #{request_count + 1} -> {url} (attempt {attempt})")
             r = session.get(url, headers=headers, timeout=20)
             status = r.status_code
+            get_pacer().record(status, r.elapsed.total_seconds())
+
+            if status == 304 and cached:
+                print(f"[scraper] 304 Not Modified, usando caché para {url}")
+                cache.touch(url)
+                return cached["body"]
 
             if status == 403:
                 print(f"[scraper] Recibido 403 (attempt {attempt}) en {url}")
@@ -153,9 +173,15 @@ def fetch_page(session: requests.Session, url: str, request_count: int, max_retr
                 else:
                     raise Exception("403 Forbidden persistente")
             r.raise_for_status()
-            return r.text
+            if cache is not None:
+                cache.store(url, r)
+            if archive is not None:
+                archive.put(url, response_bytes(r), "list")
+            return response_bytes(r) if raw else r.text
         except requests.exceptions.RequestException as e:
             print(f"[scraper] Error request attempt {attempt} para {url}: {e}")
+            if not isinstance(e, requests.exceptions.HTTPError):
+                get_pacer().record(None)
             last_exc = e
             # backoff entre reintentos
             if attempt < max_retries:
@@ -226,127 +252,367 @@ def find_next_page_url(soup):
     return None
 
 
-def collect_offers(term, max_total=MAX_RESULTS, max_pages=MAX_PAGES):
-    """
-    Colecta ofertas para un término dado usando la estrategia anti-bloqueo.
-    """
-    session = make_session()
-    collected = []
-    seen_urls = set()
-    seen_titles = set()
-    page_url = build_search_url(term)
-    pages = 0
-    request_count = 0
+A_TAG_RE = re.compile(r"<(a|link)\b([^>]*)>(?:(.*?)</a>)?", re.IGNORECASE | re.DOTALL)
+ATTR_RE = re.compile(r"([\w-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
 
-    print(f"[scraper] Iniciando recolección para término: {term}")
-    while page_url and len(collected) < max_total and pages < max_pages:
-        try:
-            print(f"[scraper] fetch page: {page_url} (page {pages+1})")
-            html = fetch_page(session, page_url, request_count)
-            request_count += 1
 
-            soup = BeautifulSoup(html, "html.parser")
-            offers = parse_offers_from_soup(soup, max_to_take=50)
-            print(f"[scraper] ofertas en página: {len(offers)}")
+def find_next_page_url_html(html):
+    """Misma lógica que find_next_page_url pero con regex sobre el HTML crudo."""
+    candidates = []
+    for tag, attrs_raw, inner in A_TAG_RE.findall(html or ""):
+        attrs = {k.lower(): html_lib.unescape(v1 or v2) for k, v1, v2 in ATTR_RE.findall(attrs_raw)}
+        if attrs.get("href"):
+            candidates.append((tag.lower(), attrs, inner))
 
-            for o in offers:
-                if not o["url"]:
-                    continue
-                if o["url"] in seen_urls:
-                    continue
-                if title_is_duplicate(o["titulo"], seen_titles):
-                    continue
-                seen_urls.add(o["url"])
-                collected.append(o)
-                if len(collected) >= max_total:
-                    break
+    for tag, attrs, _ in candidates:
+        if tag == "a" and "next" in attrs.get("rel", "").lower().split():
+            return urljoin(BASE_URL, attrs["href"])
 
-            page_url = find_next_page_url(soup)
-            pages += 1
+    for tag, attrs, inner in candidates:
+        if tag != "a":
+            continue
+        txt = html_to_text(inner).lower()
+        if "siguiente" in txt or "sig." in txt or "next" in txt:
+            return urljoin(BASE_URL, attrs["href"])
+    return None
 
-            # Delay entre páginas
-            if page_url and len(collected) < max_total:
-                smart_delay(request_count)
 
-        except Exception as e:
-            print(f"[scraper] Error en collect_offers (page {pages+1}): {e}")
-            # Si fue un 403 persistente, damos una pausa larga y salimos (puedes ajustar)
-            if "403" in str(e).lower():
-                print("[scraper] 403 persistente detectado. Pausa larga de 60s y reintento.")
-                time.sleep(60)
-                # Intentamos una vez más con la misma página
-                try:
-                    html = fetch_page(session, page_url, request_count)
-                    request_count += 1
-                    soup = BeautifulSoup(html, "html.parser")
-                    offers = parse_offers_from_soup(soup, max_to_take=50)
-                    for o in offers:
-                        if not o["url"] or o["url"] in seen_urls:
-                            continue
-                        seen_urls.add(o["url"])
-                        collected.append(o)
-                except Exception as e2:
-                    print(f"[scraper] Segundo intento falló: {e2}")
-                    break
-            else:
+def parse_list_page(html, max_to_take=50):
+    """
+    Devuelve (ofertas, next_url) de una página de listado.
+    Camino rápido: JobPosting en JSON-LD + regex para el enlace siguiente, sin DOM.
+    Solo si no hay JobPosting se construye el árbol BeautifulSoup con las heurísticas.
+    """
+    offers = offers_from_jsonld(html, BASE_URL, max_to_take=max_to_take)
+    if offers:
+        return offers, find_next_page_url_html(html)
+
+    soup = BeautifulSoup(html, "html.parser")
+    return parse_offers_from_soup(soup, max_to_take=max_to_take), find_next_page_url(soup)
+
+
+class TermCrawl:
+    """Estado de la paginación de un término dentro de crawl_terms."""
+
+    def __init__(self, term, max_total=MAX_RESULTS, max_pages=MAX_PAGES, known_urls=None):
+        """known_urls: UrlSet de URLs ya guardadas; activa el modo incremental."""
+        self.term = term
+        self.page_url = build_search_url(term)
+        self.max_total = max_total
+        self.max_pages = max_pages
+        self.pages = 0
+        self.collected = []
+        self.seen_titles = set()
+        self.known_urls = known_urls
+        self.known_streak = 0
+        # Promedio móvil de la fracción de URLs nuevas por página (arranca optimista)
+        self.yield_score = 1.0
+        self.retried_403 = False
+        self.not_before = 0.0
+        self.done = False
+
+    def to_state(self) -> dict:
+        """Frontera serializable para el checkpoint."""
+        return {
+            "page_url": self.page_url,
+            "pages": self.pages,
+            "collected": self.collected,
+            "seen_titles": sorted(self.seen_titles),
+            "known_streak": self.known_streak,
+            "yield_score": self.yield_score,
+            "done": self.done,
+        }
+
+    def restore(self, state: dict):
+        self.page_url = state.get("page_url")
+        self.pages = state.get("pages", 0)
+        self.collected = state.get("collected", [])
+        self.seen_titles = set(state.get("seen_titles", []))
+        self.known_streak = state.get("known_streak", 0)
+        self.yield_score = state.get("yield_score", 1.0)
+        self.done = state.get("done", False)
+
+    @property
+    def active(self):
+        return (not self.done and bool(self.page_url)
+                and len(self.collected) < self.max_total and self.pages < self.max_pages)
+
+    def process_page(self, html, seen_urls):
+        """
+        Parsea una página, agrega ofertas nuevas y avanza al siguiente enlace.
+        Devuelve la lista de ofertas nuevas de esta página.
+        """
+        return self.process_parsed(parse_list_html(html), seen_urls)
+
+    def process_parsed(self, parsed, seen_urls):
+        """Igual que process_page pero con el resultado de parse_list_html (ya parseado)."""
+        offers, next_url = parsed["offers"], parsed["next_url"]
+        print(f"[scraper] {self.term}: ofertas en página {self.pages + 1}: {len(offers)}")
+
+        agregadas = []
+        conocidas = 0
+        for o in offers:
+            if not o["url"]:
+                continue
+            if self.known_urls is not None and o["url"] in self.known_urls:
+                conocidas += 1
+                continue
+            if o["url"] in seen_urls:
+                continue
+            if title_is_duplicate(o["titulo"], self.seen_titles):
+                continue
+            seen_urls.add(o["url"])
+            self.collected.append(o)
+            agregadas.append(o)
+            if len(self.collected) >= self.max_total:
                 break
 
-    print(f"[scraper] total crudas para {term}: {len(collected)}")
-    return collected
+        self.page_url = next_url
+        self.pages += 1
+        ratio = len(agregadas) / len(offers) if offers else 0.0
+        self.yield_score = 0.5 * self.yield_score + 0.5 * ratio
+
+        # Modo incremental: el listado va de más reciente a más antiguo, así que tras
+        # INCREMENTAL_STOP_PAGES páginas seguidas solo con URLs conocidas se deja de paginar.
+        if self.known_urls is not None and offers:
+            self.known_streak = self.known_streak + 1 if conocidas == len(offers) else 0
+            if self.known_streak >= INCREMENTAL_STOP_PAGES:
+                print(f"[scraper] {self.term}: {self.known_streak} página(s) solo con ofertas conocidas, fin de paginación")
+                self.page_url = None
+        return agregadas
 
 
-def guardar_ofertas_db(ofertas):
-    """Guarda ofertas en DB, evitando duplicados por URL y calculando fecha_publicacion."""
+def load_known_urls():
+    """Carga en un UrlSet todas las URLs de ofertas ya guardadas en la DB."""
     app = create_app()
     with app.app_context():
-        nuevas = 0
-        for o in ofertas:
-            if not o.get("url"):
-                continue
-            existe = Oferta.query.filter_by(url=o["url"]).first()
-            if existe:
+        known = UrlSet(url for (url,) in db.session.query(Oferta.url).yield_per(5000) if url)
+    print(f"[scraper] URLs conocidas en DB: {len(known)}")
+    return known
+
+
+def fetch_and_parse(session, url, request_count, cache=None, budget=None, parser: ParsePool = None,
+                    archive: HtmlArchive = None):
+    """
+    Descarga una página de listado y la parsea en el pool de procesos.
+    Corre en un hilo de descarga: mientras espera el parseo, los demás hilos siguen con la red.
+    """
+    raw = fetch_page(session, url, request_count, cache=cache, budget=budget, raw=True, archive=archive)
+    return (parser or get_parse_pool()).run(parse_list_html, raw)
+
+
+def guardar_duplicados(pares):
+    """
+    pares: [(url_duplicada, url_original)] → ofertas.duplicado_de.
+    Debe llamarse dentro de un app_context, después de insertar las ofertas.
+    Devuelve los pares cuyas ofertas todavía no están en la DB (para reintentar).
+    """
+    if not pares:
+        return []
+    urls = {u for par in pares for u in par}
+    ids = dict(db.session.query(Oferta.url, Oferta.id).filter(Oferta.url.in_(urls)).all())
+    cambios, pendientes = [], []
+    for dup, orig in pares:
+        if dup not in ids or orig not in ids:
+            pendientes.append((dup, orig))
+        elif ids[dup] != ids[orig]:
+            cambios.append({"id": ids[dup], "duplicado_de": ids[orig]})
+    if cambios:
+        db.session.execute(update(Oferta), cambios)
+        # Si la duplicada era la original de otras (apareció una más antigua), pasan a la nueva original
+        for c in cambios:
+            db.session.execute(update(Oferta).where(Oferta.duplicado_de == c["id"])
+                               .values(duplicado_de=c["duplicado_de"]))
+    return pendientes
+
+
+def crawl_terms(terms, max_total=MAX_RESULTS, max_pages=MAX_PAGES,
+                workers=CRAWL_WORKERS, rpm=CRAWL_RPM, known_urls=None,
+                checkpoint: CrawlCheckpoint = None, resume=False, on_page=None):
+    """
+    Recorre varios términos en paralelo con una sola sesión (un pool de conexiones)
+    y un único presupuesto global de `rpm` requests por minuto.
+    En cada turno el presupuesto va primero a los términos cuyas últimas páginas
+    todavía traen URLs nuevas. Con `known_urls` (UrlSet) se omiten las ofertas ya
+    guardadas y cada término deja de paginar al llegar a ellas.
+    Con `checkpoint` la frontera se guarda tras cada página; con `resume` se parte
+    del último checkpoint en lugar de la primera página de cada término.
+    `on_page(term, ofertas_nuevas)` se llama tras cada página para procesar en streaming.
+    El parseo de cada página corre en el pool de procesos (parsing.py), no en los hilos de red.
+    Devuelve {termino: [ofertas]}.
+    """
+    session = make_session(pool_size=max(10, workers))
+    parser = get_parse_pool()
+    archive = get_default_archive()
+    cache = get_default_cache()
+    budget = TokenBucket(rpm / 60.0, CRAWL_BURST)
+    pacer = get_pacer()
+    pacer.reset_stats()
+    pacer.attach(budget)
+    crawls = [TermCrawl(t, max_total, max_pages, known_urls) for t in terms]
+    seen_urls = set()
+
+    saved = checkpoint.load("crawl") if (checkpoint is not None and resume) else None
+    if saved:
+        seen_urls = set(saved.get("seen_urls", []))
+        for c in crawls:
+            if c.term in saved.get("terms", {}):
+                c.restore(saved["terms"][c.term])
+        print(f"[scraper] Reanudando desde checkpoint: {len(seen_urls)} URLs ya vistas")
+
+    def save_checkpoint():
+        if checkpoint is not None:
+            checkpoint.save("crawl", {
+                "terms": {c.term: c.to_state() for c in crawls},
+                "seen_urls": sorted(seen_urls),
+            })
+    request_count = 0
+    in_flight = {}
+
+    print(f"[scraper] Iniciando recolección de {len(terms)} términos ({rpm} req/min, {workers} en paralelo)")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            now = time.monotonic()
+            busy = set(in_flight.values())
+            ready = [c for c in crawls if c.active and c not in busy and c.not_before <= now]
+            ready.sort(key=lambda c: (-c.yield_score, c.pages))
+            for c in ready[:workers - len(in_flight)]:
+                request_count += 1
+                print(f"[scraper] fetch page: {c.page_url} ({c.term}, page {c.pages + 1})")
+                fut = pool.submit(fetch_and_parse, session, c.page_url, request_count,
+                                  cache=cache, budget=budget, parser=parser, archive=archive)
+                in_flight[fut] = c
+
+            paused = [c.not_before - now for c in crawls if c.active and c.not_before > now]
+            if not in_flight:
+                if not paused:
+                    break
+                time.sleep(min(paused))
                 continue
 
-            raw = o.get("raw_fecha")
-            td = parse_hace_to_timedelta(raw)
-            fecha_pub = datetime.now(timezone.utc) - td if td else datetime.now(timezone.utc)
-
-            nueva = Oferta(
-                titulo=o.get("titulo"),
-                empresa=o.get("empresa"),
-                ubicacion=o.get("ubicacion"),
-                raw_fecha=raw,
-                fecha_publicacion=fecha_pub,
-                url=o.get("url"),
-                descripcion=o.get("descripcion"),  # placeholder posible
-                fuente=o.get("fuente")
-            )
-            db.session.add(nueva)
-            nuevas += 1
+            done, _ = wait(in_flight, timeout=min(paused) if paused else None, return_when=FIRST_COMPLETED)
+            for fut in done:
+                c = in_flight.pop(fut)
+                try:
+                    agregadas = c.process_parsed(fut.result(), seen_urls)
+                    if on_page is not None and agregadas:
+                        on_page(c.term, agregadas)
+                except Exception as e:
+                    print(f"[scraper] Error en {c.term} (page {c.pages + 1}): {e}")
+                    # Un 403 persistente pausa solo este término 60s y se reintenta una vez
+                    if "403" in str(e).lower() and not c.retried_403:
+                        print(f"[scraper] 403 persistente en {c.term}. Pausa de 60s para este término.")
+                        c.retried_403 = True
+                        c.not_before = time.monotonic() + 60
+                    else:
+                        c.done = True
+                save_checkpoint()
+
+    for c in crawls:
+        print(f"[scraper] total crudas para {c.term}: {len(c.collected)} ({c.pages} páginas)")
+    print(f"[scraper] Pacing: {pacer.stats()}")
+    return {c.term: c.collected for c in crawls}
+
+
+def collect_offers(term, max_total=MAX_RESULTS, max_pages=MAX_PAGES, known_urls=None,
+                   checkpoint: CrawlCheckpoint = None, resume=False):
+    """
+    Colecta ofertas para un término dado usando la estrategia anti-bloqueo.
+    """
+    return crawl_terms([term], max_total=max_total, max_pages=max_pages, known_urls=known_urls,
+                       checkpoint=checkpoint, resume=resume)[term]
+
+
+def oferta_row(o):
+    """Dict de columnas de Oferta para una oferta scrapeada (calcula fecha_publicacion)."""
+    raw = o.get("raw_fecha")
+    # datePosted del JSON-LD es exacto; si no, se estima desde "Hace X horas"
+    fecha_pub = parse_iso_datetime(o.get("fecha_publicacion"))
+    if fecha_pub is None:
+        td = parse_hace_to_timedelta(raw)
+        fecha_pub = datetime.now(timezone.utc) - td if td else datetime.now(timezone.utc)
+
+    return {
+        "titulo": o.get("titulo"),
+        "empresa": o.get("empresa"),
+        "ubicacion": o.get("ubicacion"),
+        "raw_fecha": raw,
+        "fecha_publicacion": fecha_pub,
+        "url": o.get("url"),
+        "descripcion": o.get("descripcion"),  # placeholder posible
+        "descripcion_estado": o.get("descripcion_estado") or (
+            Oferta.DESC_PENDIENTE if es_placeholder(o.get("descripcion")) else Oferta.DESC_OBTENIDA
+        ),
+        "fuente": o.get("fuente"),
+    }
+
+
+def insert_ignore(rows):
+    """
+    Inserta un bloque de filas ignorando URLs existentes.
+    Devuelve {url: id} de las filas que sí se insertaron.
+    PostgreSQL/SQLite: INSERT ... ON CONFLICT (url) DO NOTHING en un solo executemany.
+    Otros motores: una consulta de URLs existentes por bloque y luego INSERT.
+    """
+    dialect = db.engine.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = (insert(Oferta).on_conflict_do_nothing(index_elements=["url"])
+                .returning(Oferta.url, Oferta.id))
+        return {url: id_ for url, id_ in db.session.execute(stmt, rows).all()}
+
+    from sqlalchemy import insert
+    urls = [r["url"] for r in rows]
+    existentes = {u for (u,) in db.session.query(Oferta.url).filter(Oferta.url.in_(urls))}
+    rows = [r for r in rows if r["url"] not in existentes]
+    if not rows:
+        return {}
+    db.session.execute(insert(Oferta), rows)
+    nuevas = [r["url"] for r in rows]
+    return dict(db.session.query(Oferta.url, Oferta.id).filter(Oferta.url.in_(nuevas)).all())
+
+
+def guardar_ofertas_db(ofertas, chunk_size=INSERT_CHUNK_SIZE):
+    """
+    Guarda ofertas en DB en bloques de `chunk_size`, evitando duplicados por URL y
+    calculando fecha_publicacion. Devuelve (insertadas, omitidas).
+    """
+    rows = []
+    urls = set()
+    for o in ofertas:
+        if not o.get("url") or o["url"] in urls:
+            continue
+        urls.add(o["url"])
+        rows.append(oferta_row(o))
+
+    app = create_app()
+    with app.app_context():
+        nuevas = 0
+        for i in range(0, len(rows), chunk_size):
+            nuevas += len(insert_ignore(rows[i:i + chunk_size]))
         db.session.commit()
-        print(f"[scraper] guardadas en DB: {nuevas}")
+
+    omitidas = len(ofertas) - nuevas
+    print(f"[scraper] guardadas en DB: {nuevas} (omitidas: {omitidas})")
+    return nuevas, omitidas
 
 
-def main():
-    """Scraper principal. Mantiene compatibilidad con tu flujo actual."""
+def main(incremental=INCREMENTAL, resume=False):
+    """
+    Scraper principal. Mantiene compatibilidad con tu flujo actual.
+    resume: continúa el crawl desde el último checkpoint si un proceso anterior murió.
+    """
     todas_filtradas = []
-    for i, term in enumerate(SEARCH_TERMS):
-        print(f"[main] Procesando término {i+1}/{len(SEARCH_TERMS)}: {term}")
-        try:
-            crudas = collect_offers(term)
-            filtradas = apply_filters(crudas)
-            print(f"[main] después de filtros para {term}: {len(filtradas)}")
-            todas_filtradas.extend(filtradas)
-
-            # Pausa realista entre términos
-            if i < len(SEARCH_TERMS) - 1:
-                pausa = random.uniform(30, 90)
-                print(f"[main] Pausa entre términos: {pausa:.1f}s")
-                time.sleep(pausa)
-
-        except Exception as e:
-            print(f"[main] Error procesando término {term}: {e}")
-            continue
+    known_urls = load_known_urls() if incremental else None
+    checkpoint = CrawlCheckpoint()
+    crudas_por_termino = crawl_terms(SEARCH_TERMS, known_urls=known_urls, checkpoint=checkpoint, resume=resume)
+    for term, crudas in crudas_por_termino.items():
+        filtradas = apply_filters(crudas)
+        print(f"[main] después de filtros para {term}: {len(filtradas)}")
+        todas_filtradas.extend(filtradas)
 
     # Eliminar duplicados globales por URL
     seen_urls_global = set()
@@ -358,8 +624,10 @@ def main():
         final_guardar.append(o)
 
     print(f"[main] Guardando {len(final_guardar)} ofertas en DB...")
-    guardar_ofertas_db(final_guardar)
-    print(f"[main] Scraping completado. Total final: {len(final_guardar)}")
+    nuevas, omitidas = guardar_ofertas_db(final_guardar)
+    # Las ofertas ya están en la DB: el checkpoint del crawl deja de ser necesario
+    checkpoint.clear("crawl")
+    print(f"[main] Scraping completado. Total final: {len(final_guardar)} ({nuevas} nuevas, {omitidas} ya existentes)")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,13 @@
+import hashlib
 import time
 import re
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+
+from .config import LOCAL_UTC_OFFSET_HOURS
+
+LOCAL_TZ = timezone(timedelta(hours=LOCAL_UTC_OFFSET_HOURS))
+_SOLO_FECHA = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 def sleep_between_requests(seconds):
      
@@ -37,15 +43,74 @@ def parse_hace_to_timedelta(text: str):
         return timedelta(hours=0)
     return None
 
+def parse_iso_datetime(text: str):
+    """Parsea fechas ISO 8601 (datePosted de JSON-LD). Sin zona horaria se asume UTC."""
+    if not text:
+        return None
+    try:
+        dt = datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
 def within_last_24h(text_fecha: str) -> bool:
     td = parse_hace_to_timedelta(text_fecha)
     if td is None:
         return False
     return td <= timedelta(days=1)
 
+def published_within_last_24h(fecha_iso: str) -> bool:
+    """
+    datePosted con hora: publicada hace ≤24h. Solo fecha ("2024-05-10"): se compara el día
+    en hora local (medianoche UTC son las 19:00 del día anterior en Colombia), así una
+    oferta de hoy o de ayer pasa aunque ya hayan corrido 24h desde esa medianoche.
+    """
+    if fecha_iso and _SOLO_FECHA.fullmatch(fecha_iso.strip()):
+        try:
+            dia = date.fromisoformat(fecha_iso.strip())
+        except ValueError:
+            return False
+        return datetime.now(LOCAL_TZ).date() - dia <= timedelta(days=1)
+    dt = parse_iso_datetime(fecha_iso)
+    if dt is None:
+        return False
+    return datetime.now(timezone.utc) - dt <= timedelta(days=1)
+
+PLACEHOLDERS = ("oferta oculta", "descripción no disponible")
+
+def es_placeholder(desc) -> bool:
+    """True si la descripción es un texto de relleno ("Oferta oculta", "Descripción no disponible (...)")."""
+    return not desc or desc.strip().lower().startswith(PLACEHOLDERS)
+
 def title_is_duplicate(title: str, seen_titles: set) -> bool:
     n = normalize_text(title)
     if n in seen_titles:
         return True
     seen_titles.add(n)
     return False
+
+class UrlSet:
+    """
+    Conjunto compacto de URLs: guarda un hash de 64 bits por URL en lugar del string.
+    Pensado para cargar en memoria todas las URLs ya guardadas en la DB.
+    """
+
+    def __init__(self, urls=()):
+        self._hashes = set()
+        for url in urls:
+            self.add(url)
+
+    @staticmethod
+    def _key(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def add(self, url: str):
+        self._hashes.add(self._key(url))
+
+    def __contains__(self, url) -> bool:
+        return bool(url) and self._key(url) in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
@@ -0,0 +1,246 @@
+import argparse
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from app import create_app, db
+from app.models.models import AnalisisResultado, Oferta
+from app.scrapers.computrabajo.config import (
+    DETAIL_WORKERS, DETAIL_RATE, DETAIL_BURST, INCREMENTAL, DETAIL_GONE_STATUS
+)
+from app.scrapers.computrabajo.failures import registrar_resultado, urls_no_elegibles
+from app.scrapers.computrabajo.filters import apply_filters
+from app.scrapers.computrabajo.archive import get_default_archive
+from app.scrapers.computrabajo.dedup import empresa_clave, orden_oferta
+from app.scrapers.computrabajo.http_cache import get_default_cache
+from app.scrapers.computrabajo.micro_scraper_description import DescriptionScraper, load_description_index
+from app.scrapers.computrabajo.pacing import get_pacer
+from app.scrapers.computrabajo.rate_limiter import HostRateLimiter
+from app.scrapers.computrabajo.scraper import (
+    SEARCH_TERMS, crawl_terms, load_known_urls, oferta_row, insert_ignore,
+    guardar_duplicados
+)
+from run_processing import STACK, analizar_oferta
+from scripts.calc_compatibilidad import calcular_compatibilidad, skills_desde_columnas
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Tamaño de las colas entre etapas: si una etapa se atrasa, las anteriores esperan
+QUEUE_SIZE = 100
+# Ofertas por commit en la etapa de escritura (o lo que haya FLUSH_SECONDS después de la primera del lote)
+BATCH_SIZE = 20
+FLUSH_SECONDS = 10
+
+FIN = None  # marca de fin de cola
+
+
+def etapa_crawl(q_salida, incremental, detalle_workers):
+    """Listados → filtros → cola de detalle, página por página."""
+    vistas = set()
+
+    def on_page(term, ofertas):
+        nuevas = []
+        for o in apply_filters(ofertas):
+            if o["url"] in vistas:
+                continue
+            vistas.add(o["url"])
+            nuevas.append(o)
+        for o in nuevas:
+            q_salida.put(o)
+
+    try:
+        known_urls = load_known_urls() if incremental else None
+        crawl_terms(SEARCH_TERMS, known_urls=known_urls, on_page=on_page)
+    except Exception:
+        logger.exception("Error en la etapa de crawl")
+    finally:
+        for _ in range(detalle_workers):
+            q_salida.put(FIN)
+
+
+def etapa_detalle(scraper, q_entrada, q_salida, no_elegibles):
+    """
+    Descarga la descripción completa; si falla se conserva la del listado.
+    Las URLs de `no_elegibles` (404/410 o todavía en espera tras fallar, ver failures.py)
+    no se piden: pasan con la descripción del listado, como en update_missing_descriptions.
+    """
+    while True:
+        o = q_entrada.get()
+        if o is FIN:
+            q_salida.put(FIN)
+            return
+        if o["url"] in no_elegibles:
+            q_salida.put(o)
+            continue
+        try:
+            result = scraper.fetch_detail(o["url"])
+            o["detalle_status"] = result.status
+            if result.ok:
+                o["descripcion"] = result.descripcion
+                o["descripcion_estado"] = Oferta.DESC_OBTENIDA
+                o["detalle_ok"] = True
+            elif result.status in DETAIL_GONE_STATUS:
+                o["descripcion_estado"] = Oferta.DESC_ELIMINADA
+            else:
+                o["descripcion_estado"] = Oferta.DESC_FALLIDA
+        except Exception:
+            logger.exception(f"Error en detalle de {o['url']}")
+        q_salida.put(o)
+
+
+def etapa_analisis(q_entrada, q_salida, productores, desc_index):
+    """
+    Stack, modalidad, nivel y compatibilidad de las ofertas con descripción completa.
+    Si la descripción repite la de otra oferta, la más nueva de las dos queda como duplicada
+    de la más antigua; una duplicada no se analiza.
+    """
+    terminados = 0
+    while True:
+        o = q_entrada.get()
+        if o is FIN:
+            terminados += 1
+            if terminados == productores:
+                q_salida.put(FIN)
+                return
+            continue
+        try:
+            if o.get("detalle_ok"):
+                orden = orden_oferta(oferta_row(o)["fecha_publicacion"])
+                par = desc_index.add(o["url"], f"{o['titulo']} {o['descripcion']}", empresa_clave(o.get("empresa")),
+                                     o["titulo"], orden)
+                if par is not None and par[0] == o["url"]:
+                    o["duplicado_de_url"] = par[1]
+                elif par is not None:
+                    # Esta es más antigua que la indexada: la indexada pasa a ser su duplicada
+                    o["reemplaza_url"] = par[0]
+            if o.get("detalle_ok") and not o.get("duplicado_de_url"):
+                campos = analizar_oferta(o["titulo"], o["descripcion"])
+                skills = skills_desde_columnas({cat: campos[cat] for cat in STACK})
+                campos["compatibilidad"] = calcular_compatibilidad(skills, campos["nivel_score"])
+                o["analisis"] = campos
+        except Exception:
+            logger.exception(f"Error analizando {o['url']}")
+        q_salida.put(o)
+
+
+def escribir_lote(lote, duplicados_pendientes):
+    """
+    Inserta ofertas y sus análisis en un solo commit. Devuelve los análisis escritos.
+    `duplicados_pendientes` acumula los enlaces a originales que aún no llegaron a la DB.
+    """
+    rows = [oferta_row(o) for o in lote]
+    ids = insert_ignore(rows)
+    pares = duplicados_pendientes + [(o["url"], o["duplicado_de_url"]) for o in lote if o.get("duplicado_de_url")]
+    pares += [(o["reemplaza_url"], o["url"]) for o in lote if o.get("reemplaza_url")]
+    duplicados_pendientes[:] = guardar_duplicados(pares)
+    for o in lote:
+        # Detalles fallidos: al caché negativo para que update_missing_descriptions respete la espera
+        if "detalle_status" in o and not o.get("detalle_ok") and o["url"] in ids:
+            registrar_resultado(o["url"], False, o["detalle_status"])
+    analisis = []
+    for o, row in zip(lote, rows):
+        if not o.get("analisis") or o["url"] not in ids:
+            continue
+        analisis.append({
+            "oferta_id": ids[o["url"]],
+            "url": o["url"],
+            "fecha": row["fecha_publicacion"],
+            "ciudad": row["ubicacion"],
+            "cargo": row["titulo"],
+            "fecha_analisis": datetime.utcnow(),
+            **o["analisis"],
+        })
+    if analisis:
+        db.session.execute(insert(AnalisisResultado), analisis)
+    db.session.commit()
+    return analisis
+
+
+def run_pipeline(incremental=INCREMENTAL, detalle_workers=DETAIL_WORKERS):
+    """
+    Pipeline en streaming: crawl → filtros → detalle → análisis → escritura.
+    Cada etapa corre en su propio hilo y se comunica por colas acotadas, así el
+    análisis y las escrituras se solapan con las esperas de red y los primeros
+    resultados rankeados quedan en la DB a los pocos minutos.
+    """
+    q_detalle = queue.Queue(maxsize=QUEUE_SIZE)
+    q_analisis = queue.Queue(maxsize=QUEUE_SIZE)
+    q_escritura = queue.Queue(maxsize=QUEUE_SIZE)
+
+    app = create_app()
+    with app.app_context():
+        desc_index, _ = load_description_index()
+        no_elegibles = urls_no_elegibles()
+    logger.info(f"URLs de detalle omitidas por fallos previos: {len(no_elegibles)}")
+
+    pacer = get_pacer()
+    scraper = DescriptionScraper(
+        rate_limiter=HostRateLimiter(DETAIL_RATE, DETAIL_BURST, pacer=pacer),
+        workers=detalle_workers,
+        cache=get_default_cache(),
+        archive=get_default_archive()
+    )
+
+    hilos = [threading.Thread(target=etapa_crawl, args=(q_detalle, incremental, detalle_workers), daemon=True)]
+    hilos += [
+        threading.Thread(target=etapa_detalle, args=(scraper, q_detalle, q_analisis, no_elegibles), daemon=True)
+        for _ in range(detalle_workers)
+    ]
+    hilos.append(threading.Thread(target=etapa_analisis, args=(q_analisis, q_escritura, detalle_workers, desc_index),
+                                  daemon=True))
+    for h in hilos:
+        h.start()
+
+    # La escritura queda en el hilo principal: una sola sesión de DB
+    with app.app_context():
+        lote = []
+        ofertas_escritas = 0
+        mejores = []
+        duplicados_pendientes = []
+        terminado = False
+        limite = None  # momento en que vence el lote en curso
+        while not terminado:
+            espera = FLUSH_SECONDS if limite is None else max(0.0, limite - time.monotonic())
+            try:
+                o = q_escritura.get(timeout=espera)
+                if o is FIN:
+                    terminado = True
+                else:
+                    if not lote:
+                        limite = time.monotonic() + FLUSH_SECONDS
+                    lote.append(o)
+            except queue.Empty:
+                pass
+
+            if lote and (terminado or len(lote) >= BATCH_SIZE or time.monotonic() >= limite):
+                try:
+                    analisis = escribir_lote(lote, duplicados_pendientes)
+                    ofertas_escritas += len(lote)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Error escribiendo lote")
+                    analisis = []
+                lote = []
+                limite = None
+
+                mejores = sorted(mejores + analisis, key=lambda a: a["compatibilidad"], reverse=True)[:5]
+                logger.info(f"Lote escrito: {len(analisis)} análisis ({ofertas_escritas} ofertas en total)")
+                for a in mejores:
+                    logger.info(f"   {a['compatibilidad']:.2f} | {a['cargo']} | {a['url']}")
+
+    for h in hilos:
+        h.join()
+    logger.info(f"🎉 Pipeline terminado. Ofertas escritas: {ofertas_escritas}. Pacing: {pacer.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pipeline en streaming: scraping → análisis → compatibilidad")
+    parser.add_argument("--workers", type=int, default=DETAIL_WORKERS, help="descargas de detalle en paralelo")
+    parser.add_argument("--full", action="store_true", help="desactiva el modo incremental")
+    args = parser.parse_args()
+    run_pipeline(incremental=not args.full, detalle_workers=args.workers)
@@ -1,131 +1,215 @@
+import argparse
+import hashlib
 import logging
-import re
+import os
 from datetime import datetime
+from sqlalchemy import insert, update
+from sqlalchemy.exc import SQLAlchemyError
 from app import create_app, db
 from app.models.models import Oferta, AnalisisResultado
-from app.processing.utils import normalize_text
-from app.processing.nivel_detector import calcular_nivel_score  # 🆕 NUEVO
+from app.processing.analyzer import get_analizador
+from app.process_pool import ProcessPool
 
 logging.basicConfig(level=logging.INFO)
 
-# 🧩 Diccionario de stack tecnológico (sin cambios)
-STACK = {
-    "lenguajes": [
-        "php", "javascript", "node.js", "c#", "html5", "css3", "sql",
-        "json", "c", "linq", "typescript", "python"
-    ],
-    "frameworks": [
-        "shopify", "magento", "woocommerce", "vtex",
-        "laravel", "vue.js", "quasar", "angular",
-        ".net core", "asp.net core", "scrum", "kanban",
-        "wordpress", "odoo"
-    ],
-    "librerias": ["bootstrap", "jquery", "ajax"],
-    "bases_datos": ["mysql", "sql server", "mongodb"],
-    "nube_devops": ["azure", "azure devops", "docker", "kubernetes"],
-    "control_versiones": ["git"],
-    "arquitectura_metodologias": [
-        "microservicios", "restful", "soa", "poo", "async/await",
-        "inyección de dependencias", "singleton", "solid",
-        "cliente-servidor", "n-capas"
-    ],
-    "integraciones": ["pasarelas de pago", "apis", "webservices"],
-    "inteligencia_artificial": ["inteligencia artificial", "ia"],
-    "ofimatica_gestion": [
-        "jira", "asana", "trello", "excel", "google workspace",
-        "drive", "sheets", "docs"
-    ],
-    "ciberseguridad": ["ciberseguridad", "unit testing", "buenas prácticas"],
-    "marketing_digital": ["seo", "marketing digital"],
-    "erp_lowcode": ["wordpress", "odoo"]
-}
-
-
-def detectar_modalidad(texto: str) -> str:
-    """Detecta modalidad en el texto de la descripción."""
-    texto = texto.lower()
-    if any(p in texto for p in ["remoto", "teletrabajo", "home office"]):
-        return "Remoto"
-    if "híbrido" in texto or "mixto" in texto:
-        return "Híbrido"
-    if "presencial" in texto or "en oficina" in texto:
-        return "Presencial"
-    return None
-
-
-def extraer_stack(texto: str) -> dict:
-    """Extrae stack tecnológico de la descripción según categorías."""
-    if not texto:
-        return {cat: [] for cat in STACK.keys()}
+# 🧩 Stack tecnológico: categorías y tecnologías de la taxonomía versionada
+ANALIZADOR = get_analizador()
+TAXONOMIA = ANALIZADOR.taxonomia
+STACK = {cat: list(techs) for cat, techs in TAXONOMIA.categorias.items()}
 
-    texto = normalize_text(texto)
-    encontrados = {cat: [] for cat in STACK.keys()}
+# Subir cuando cambie la lógica de análisis (modalidad, stack o nivel): obliga a re-analizar todo
+VERSION_ANALIZADOR = 2  # 2: analyzer.py (la modalidad se busca en el texto normalizado)
 
-    for categoria, items in STACK.items():
-        for item in items:
-            pattern = r"\b" + re.escape(item.lower()) + r"\b"
-            if re.search(pattern, texto):
-                encontrados[categoria].append(item)
+# Ofertas por lote: un INSERT/UPDATE masivo y un commit por lote
+LOTE_ESCRITURA = 500
 
-    # Convertir listas a strings separados por coma
-    return {cat: ", ".join(sorted(set(vals))) for cat, vals in encontrados.items()}
+# Procesos para el análisis desde la línea de comandos (0 = en el proceso principal); las
+# escrituras quedan en el principal. Llamado como librería (Flask, run_all) main corre sin pool.
+WORKERS_ANALISIS = max(1, (os.cpu_count() or 2) - 1)
 
 
-def main():
+def extraer_stack(texto: str, normalizado: bool = False) -> dict:
+    """Extrae stack tecnológico de la descripción según categorías."""
+    # Convertir listas a strings separados por coma
+    return {cat: ", ".join(vals) for cat, vals in TAXONOMIA.extraer(texto, normalizado).items()}
+
+
+def hash_contenido(titulo: str, descripcion: str) -> str:
+    """sha256 de título + descripción: si no cambia, el análisis guardado sigue valiendo."""
+    return hashlib.sha256(f"{titulo or ''}\n{descripcion or ''}".encode("utf-8")).hexdigest()
+
+
+def analisis_vigente(previo: tuple, huella: str) -> bool:
+    """
+    El análisis guardado, (hash_contenido, version_analizador, taxonomia_version),
+    corresponde al mismo contenido y a las versiones actuales.
+    """
+    return previo == (huella, VERSION_ANALIZADOR, TAXONOMIA.version)
+
+
+def analizar_oferta(titulo: str, descripcion: str) -> dict:
+    """
+    Análisis de una oferta: modalidad, stack por categoría, nivel_score, las
+    versiones usadas y el hash del contenido analizado.
+    Devuelve un dict con los nombres de columna de AnalisisResultado.
+    """
+    # Una sola normalización y una sola pasada para stack, modalidad y nivel
+    campos = ANALIZADOR.analizar(titulo, descripcion).columnas()
+    campos["taxonomia_version"] = TAXONOMIA.version
+    campos["version_analizador"] = VERSION_ANALIZADOR
+    campos["hash_contenido"] = hash_contenido(titulo, descripcion)
+    return campos
+
+
+def analizar_tarea(tarea: tuple) -> tuple:
+    """
+    Corre en un proceso del pool: (oferta_id, titulo, descripcion) →
+    (oferta_id, hash_contenido, modalidad, nivel_score, columnas de stack en el orden de STACK).
+    Una tupla chica en lugar del dict: es lo que viaja de vuelta entre procesos.
+    """
+    oferta_id, titulo, descripcion = tarea
+    campos = analizar_oferta(titulo, descripcion)
+    return (oferta_id, campos["hash_contenido"], campos["modalidad"], campos["nivel_score"],
+            tuple(campos[cat] for cat in STACK))
+
+
+def campos_de_tarea(resultado: tuple) -> dict:
+    """Inversa de analizar_tarea: el dict de columnas que devuelve analizar_oferta."""
+    _, huella, modalidad, nivel_score, stack = resultado
+    campos = {"modalidad": modalidad, **dict(zip(STACK, stack)), "nivel_score": nivel_score}
+    campos.update(taxonomia_version=TAXONOMIA.version, version_analizador=VERSION_ANALIZADOR,
+                  hash_contenido=huella)
+    return campos
+
+
+def fila_analisis(o, campos: dict) -> dict:
+    """Fila de analisis_resultados: datos de la oferta + el análisis."""
+    return {
+        "oferta_id": o.id,
+        "fecha": o.fecha_publicacion,
+        "ciudad": o.ubicacion,
+        "cargo": o.titulo,
+        "url": o.url,  # 🆕 Asegurar que URL esté presente
+        "fecha_analisis": datetime.utcnow(),
+        **campos,
+    }
+
+
+def cargar_resultados() -> dict:
+    """oferta_id → (id, hash_contenido, version_analizador, taxonomia_version), en una sola consulta."""
+    query = db.session.query(
+        AnalisisResultado.oferta_id, AnalisisResultado.id, AnalisisResultado.hash_contenido,
+        AnalisisResultado.version_analizador, AnalisisResultado.taxonomia_version,
+    ).order_by(AnalisisResultado.id)
+    # Si una oferta tuviera varios resultados se actualiza el primero, como hacía .first()
+    resultados = {}
+    for oferta_id, *resto in query.yield_per(5000):
+        resultados.setdefault(oferta_id, tuple(resto))
+    return resultados
+
+
+def lotes_de_ofertas(tamano: int):
+    """
+    Ofertas a analizar en lotes de `tamano`, paginadas por id. Cada lote es una
+    consulta nueva: los commits entre lotes no invalidan ningún cursor abierto.
+    """
+    ultimo_id = 0
+    while True:
+        lote = (
+            db.session.query(Oferta.id, Oferta.titulo, Oferta.descripcion,
+                             Oferta.fecha_publicacion, Oferta.ubicacion, Oferta.url)
+            # Solo descripciones reales (no placeholders); las re-publicaciones no se analizan de nuevo
+            .filter(Oferta.descripcion_estado == Oferta.DESC_OBTENIDA, Oferta.duplicado_de.is_(None),
+                    Oferta.id > ultimo_id)
+            .order_by(Oferta.id)
+            .limit(tamano)
+            .all()
+        )
+        if not lote:
+            return
+        yield lote
+        ultimo_id = lote[-1].id
+
+
+def escribir_lote(nuevos: list, actualizados: list):
+    """Un INSERT y un UPDATE masivos (por clave primaria) y un solo commit por lote."""
+    if nuevos:
+        db.session.execute(insert(AnalisisResultado), nuevos)
+    if actualizados:
+        db.session.execute(update(AnalisisResultado), actualizados)
+    db.session.commit()
+
+
+def main(forzar: bool = False, lote: int = LOTE_ESCRITURA, workers: int = 0):
+    """
+    `forzar=True` re-analiza todas las ofertas aunque su contenido no haya cambiado.
+    El análisis (CPU puro) se reparte en `workers` procesos, creados con "spawn" para
+    no heredar hilos ni conexiones de quien llama; la DB se escribe solo desde el
+    proceso principal.
+    Cada lote se confirma por separado: si uno falla, los anteriores quedan guardados
+    y la siguiente corrida retoma desde ahí (lo ya escrito se omite por su hash).
+    """
     logging.info("🔎 Iniciando procesamiento real...")
 
     app = create_app()
     with app.app_context():
-        ofertas = Oferta.query.filter(Oferta.descripcion.isnot(None)).all()
-
-        for o in ofertas:
-            # Buscar si ya existe resultado previo
-            resultado = AnalisisResultado.query.filter_by(oferta_id=o.id).first()
-            if not resultado:
-                resultado = AnalisisResultado(oferta_id=o.id)
-
-            # Copiar datos de oferta
-            resultado.fecha = o.fecha_publicacion
-            resultado.ciudad = o.ubicacion
-            resultado.modalidad = detectar_modalidad(o.descripcion or "")
-            resultado.cargo = o.titulo
-            resultado.url = o.url  # 🆕 Asegurar que URL esté presente
-
-            # Extraer stack tecnológico
-            stack = extraer_stack(o.descripcion or "")
-            resultado.lenguajes = stack["lenguajes"]
-            resultado.frameworks = stack["frameworks"]
-            resultado.librerias = stack["librerias"]
-            resultado.bases_datos = stack["bases_datos"]
-            resultado.nube_devops = stack["nube_devops"]
-            resultado.control_versiones = stack["control_versiones"]
-            resultado.arquitectura_metodologias = stack["arquitectura_metodologias"]
-            resultado.integraciones = stack["integraciones"]
-            resultado.inteligencia_artificial = stack["inteligencia_artificial"]
-            resultado.ofimatica_gestion = stack["ofimatica_gestion"]
-            resultado.ciberseguridad = stack["ciberseguridad"]
-            resultado.marketing_digital = stack["marketing_digital"]
-            resultado.erp_lowcode = stack["erp_lowcode"]
-
-            # 🆕 NUEVO: Calcular scoring de nivel
-            texto_completo = f"{o.titulo} {o.descripcion or ''}"
-            resultado.nivel_score = calcular_nivel_score(texto_completo)
-
-            # Fecha del análisis
-            resultado.fecha_analisis = datetime.utcnow()
-
-            db.session.add(resultado)
-            db.session.commit()
-
-            logging.info(
-                f"Oferta {o.id} procesada → "
-                f"Nivel: {resultado.nivel_score} | "
-                f"Lenguajes: {resultado.lenguajes} | "
-                f"Frameworks: {resultado.frameworks}"
-            )
-
-        logging.info("✅ Procesamiento terminado. Datos guardados en analisis_resultados.")
+        resultados = cargar_resultados()
+        omitidas = procesadas = lotes_fallidos = 0
+        pool = ProcessPool(workers, start_method="spawn")
+        try:
+            for ofertas in lotes_de_ofertas(lote):
+                pendientes = []
+                for o in ofertas:
+                    previo = resultados.get(o.id)
+                    huella = hash_contenido(o.titulo, o.descripcion)
+                    if previo and not forzar and analisis_vigente(previo[1:], huella):
+                        # Mismo título y descripción, mismas versiones: el análisis no cambiaría
+                        omitidas += 1
+                        continue
+                    pendientes.append(o)
+
+                # El pool devuelve los resultados en el orden de las tareas: la escritura es determinista
+                tareas = [(o.id, o.titulo, o.descripcion) for o in pendientes]
+                chunksize = max(1, len(tareas) // (4 * pool.workers)) if pool.workers else 1
+                nuevos, actualizados = [], []
+                for o, resultado in zip(pendientes, pool.map(analizar_tarea, tareas, chunksize=chunksize)):
+                    fila = fila_analisis(o, campos_de_tarea(resultado))
+                    previo = resultados.get(o.id)
+                    if previo:
+                        actualizados.append({"id": previo[0], **fila})
+                    else:
+                        nuevos.append(fila)
+
+                if not nuevos and not actualizados:
+                    continue
+                try:
+                    escribir_lote(nuevos, actualizados)
+                except SQLAlchemyError:
+                    db.session.rollback()
+                    lotes_fallidos += 1
+                    logging.exception(
+                        f"❌ Falló el lote de ofertas {ofertas[0].id}-{ofertas[-1].id}; "
+                        f"se reintentará en la próxima corrida"
+                    )
+                    continue
+                procesadas += len(nuevos) + len(actualizados)
+                logging.info(
+                    f"Lote {ofertas[0].id}-{ofertas[-1].id}: "
+                    f"{len(nuevos)} nuevas, {len(actualizados)} actualizadas"
+                )
+        finally:
+            pool.shutdown()
+
+        logging.info(f"⏭️ {omitidas} ofertas sin cambios desde el último análisis")
+        if lotes_fallidos:
+            logging.warning(f"⚠️ {lotes_fallidos} lotes fallidos")
+        logging.info(f"✅ Procesamiento terminado: {procesadas} análisis guardados en analisis_resultados.")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Análisis de ofertas: stack, modalidad y nivel")
+    parser.add_argument("--forzar", action="store_true", help="re-analiza todo, aunque no haya cambios")
+    parser.add_argument("--lote", type=int, default=LOTE_ESCRITURA, help="ofertas por commit")
+    parser.add_argument("--workers", type=int, default=WORKERS_ANALISIS, help="procesos de análisis (0 = sin pool)")
+    args = parser.parse_args()
+    main(args.forzar, args.lote, args.workers)
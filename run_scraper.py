@@ -1,13 +1,14 @@
+import argparse
 import logging
 from app.scrapers.computrabajo.micro_scraper_description import get_offers, get_details
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def main():
+def main(resume=False):
     try:
         logger.info("Starting offers scraper...")
-        get_offers()
+        get_offers(resume=resume)
         logger.info("Offers scraper finished.")
 
         logger.info("Starting details scraper...")
@@ -19,4 +20,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scraper de ofertas y descripciones")
+    parser.add_argument("--resume", action="store_true",
+                        help="continuar el crawl de listados desde el último checkpoint (los detalles pendientes siempre se retoman)")
+    args = parser.parse_args()
+    main(resume=args.resume)
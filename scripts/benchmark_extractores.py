@@ -0,0 +1,124 @@
+"""
+Compara la extracción de stack y el score de nivel (un regex por palabra clave)
+con el KeywordMatcher, y el análisis por detectores separados con el analizador
+fusionado, sobre las ofertas de data.json: verifica que den lo mismo y mide el tiempo.
+
+Uso:
+    python -m scripts.benchmark_extractores [--data data.json] [--repeticiones 20]
+"""
+import argparse
+import json
+import re
+import time
+
+from app.processing.analyzer import get_analizador
+from app.processing.nivel_detector import NIVEL_KEYWORDS, calcular_nivel_score, calcular_nivel_scores
+from app.processing.tech_extractor import TECH_CATEGORIES, TECH_SYNONYMS, extract_stack
+from app.processing.utils import normalize_text
+from run_processing import extraer_stack
+
+
+def extract_stack_por_regex(text):
+    """Implementación anterior de extract_stack (un re.search por sinónimo), como referencia."""
+    if not text:
+        return {cat: [] for cat in TECH_CATEGORIES}
+    text = normalize_text(text)
+    found = {cat: [] for cat in TECH_CATEGORIES}
+    for category, tech_list in TECH_CATEGORIES.items():
+        for tech in tech_list:
+            for syn in TECH_SYNONYMS.get(tech, [tech]):
+                if re.search(r"\b" + re.escape(syn.lower()) + r"\b", text):
+                    found[category].append(tech)
+                    break
+    return {cat: sorted(set(v)) for cat, v in found.items()}
+
+
+def extraer_stack_por_regex(texto):
+    """Referencia de run_processing.extraer_stack: la misma extracción, con las columnas como texto."""
+    return {cat: ", ".join(vals) for cat, vals in extract_stack_por_regex(texto).items()}
+
+
+def calcular_nivel_score_por_regex(texto_completo):
+    """Implementación anterior de calcular_nivel_score (un re.search por palabra), como referencia."""
+    if not texto_completo:
+        return 0
+    texto = normalize_text(texto_completo)
+    score = 0
+    for lista, puntos, maximo in (("junior_positivo", 2, 3), ("junior_negativo", -3, 2),
+                                  ("mid_keywords", -1, 1), ("senior_keywords", -2, 2)):
+        encontradas = sum(1 for kw in NIVEL_KEYWORDS[lista]
+                          if re.search(r"\b" + re.escape(kw.lower()) + r"\b", texto))
+        score += puntos * min(encontradas, maximo)
+    return max(-10, min(10, score))
+
+
+def analizar_por_separado(oferta):
+    """Análisis anterior a analyzer.py: cada detector normaliza y recorre el texto por su cuenta."""
+    titulo, descripcion = oferta
+    texto = (descripcion or "").lower()
+    if any(p in texto for p in ["remoto", "teletrabajo", "home office"]):
+        modalidad = "Remoto"
+    elif "híbrido" in texto or "mixto" in texto:
+        modalidad = "Híbrido"
+    elif "presencial" in texto or "en oficina" in texto:
+        modalidad = "Presencial"
+    else:
+        modalidad = None
+    return {
+        "modalidad": modalidad,
+        **extraer_stack_por_regex(descripcion or ""),
+        "nivel_score": calcular_nivel_score_por_regex(f"{titulo} {descripcion or ''}"),
+    }
+
+
+def analizar_fusionado(oferta):
+    return get_analizador().analizar(*oferta).columnas()
+
+
+def medir(func, textos, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultados = [func(t) for t in textos]
+    total = time.perf_counter() - inicio
+    return total, resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de extracción de stack")
+    parser.add_argument("--data", default="data.json")
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.data, "r", encoding="utf-8") as f:
+        ofertas = json.load(f)
+    textos = [f"{o.get('titulo') or ''} {o.get('descripcion') or ''}" for o in ofertas]
+    n = len(textos) * args.repeticiones
+
+    reporte = {"ofertas": len(textos), "repeticiones": args.repeticiones}
+    pares = [(o.get("titulo"), o.get("descripcion")) for o in ofertas]
+    for nombre, antes, ahora, entradas in (
+        ("extract_stack", extract_stack_por_regex, extract_stack, textos),
+        ("extraer_stack", extraer_stack_por_regex, extraer_stack, textos),
+        ("calcular_nivel_score", calcular_nivel_score_por_regex, calcular_nivel_score, textos),
+        ("analizador_fusionado", analizar_por_separado, analizar_fusionado, pares),
+    ):
+        t_antes, r_antes = medir(antes, entradas, args.repeticiones)
+        t_ahora, r_ahora = medir(ahora, entradas, args.repeticiones)
+        reporte[nombre] = {
+            "iguales": r_antes == r_ahora,
+            "regex_por_tecnologia_ofertas_por_seg": round(n / t_antes, 1),
+            "matcher_ofertas_por_seg": round(n / t_ahora, 1),
+            "aceleracion": round(t_antes / t_ahora, 1),
+        }
+
+    # API por lotes: todos los textos en una llamada
+    t_lote, r_lote = medir(calcular_nivel_scores, [textos], args.repeticiones)
+    reporte["calcular_nivel_scores"] = {
+        "iguales": r_lote[0] == [calcular_nivel_score_por_regex(t) for t in textos],
+        "matcher_ofertas_por_seg": round(n / t_lote, 1),
+    }
+    print(json.dumps(reporte, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark offline de los scrapers (sin tocar computrabajo.com.co).
+
+Uso:
+    python -m scripts.benchmark_scraper --recordings DIR
+    python -m scripts.benchmark_scraper              # genera páginas sintéticas
+
+Las grabaciones se obtienen corriendo el scraper con HTTP_RECORD_DIR definido
+en app/scrapers/computrabajo/config.py.
+"""
+import argparse
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from app.scrapers.computrabajo.description_extractor import extract_description_single_pass
+from app.scrapers.computrabajo.micro_scraper_description import DescriptionScraper
+from app.scrapers.computrabajo.parsing import get_parse_pool, parse_list_html
+from app.scrapers.computrabajo.replay import load_recordings, save_recording, serve_recordings, path_key
+from app.scrapers.computrabajo.scraper import (
+    BASE_URL, make_session, parse_offers_from_soup, find_next_page_url, parse_list_page
+)
+
+
+def es_listado(url: str) -> bool:
+    return "/trabajo-de-" in url
+
+
+def generar_sinteticas(directory: str, paginas: int = 20, ofertas_por_pagina: int = 20):
+    """Páginas con la misma estructura que el HTML de Computrabajo (tarjetas <article>, p.mbB)."""
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+    for n in range(1, paginas + 1):
+        cards = []
+        for i in range(ofertas_por_pagina):
+            cards.append(
+                f'<article class="box_offer"><h2><a class="js-o-link" href="/ofertas-de-trabajo/oferta-{n}-{i}">'
+                f'Desarrollador Python {n}-{i}</a></h2><p class="fs16">Empresa {i} S.A.S</p>'
+                f'<p class="fs13">Medellín, Antioquia</p><p class="fs13">Hace {i + 1} horas</p>'
+                f'<p>Buscamos desarrollador con experiencia en Django, React y PostgreSQL.</p></article>'
+            )
+            detalle = (
+                "<html><body><main><h1>Desarrollador Python</h1>"
+                + "<div class='menu'>" + "<a href='#'>enlace</a>" * 50 + "</div>"
+                + "<p class='mbB'>" + "Responsabilidades: desarrollo backend con Python, Django y APIs REST. " * 15 + "</p>"
+                + "</main></body></html>"
+            )
+            save_recording(directory, f"{BASE_URL}/ofertas-de-trabajo/oferta-{n}-{i}", 200, headers, detalle.encode())
+        siguiente = f'<a rel="next" href="/trabajo-de-desarrollador-en-antioquia?p={n + 1}">Siguiente</a>' if n < paginas else ""
+        nav = "<nav>" + '<a href="#">x</a>' * 100 + "</nav>"
+        html = f"<html><body>{nav}{''.join(cards)}{siguiente}</body></html>"
+        sufijo = f"?p={n}" if n > 1 else ""
+        save_recording(directory, f"{BASE_URL}/trabajo-de-desarrollador-en-antioquia{sufijo}", 200, headers, html.encode())
+
+
+def medir(func, paginas):
+    """Ejecuta func sobre cada página; devuelve (ms por página, resultados)."""
+    resultados = []
+    inicio = time.perf_counter()
+    for html in paginas:
+        resultados.append(func(html))
+    total = time.perf_counter() - inicio
+    return (total * 1000 / len(paginas)) if paginas else 0.0, resultados
+
+
+def bench_parse(recordings):
+    listados = [body.decode("utf-8", "replace") for meta, body in recordings if es_listado(meta["url"])]
+    detalles = [body.decode("utf-8", "replace") for meta, body in recordings if not es_listado(meta["url"])]
+    reporte = {"paginas_listado": len(listados), "paginas_detalle": len(detalles)}
+
+    ms, res = medir(lambda h: parse_offers_from_soup(BeautifulSoup(h, "html.parser")), listados)
+    reporte["parse_offers_from_soup"] = {
+        "ms_por_pagina": round(ms, 3),
+        "ofertas_por_pagina": round(sum(map(len, res)) / len(res), 2) if res else 0,
+    }
+
+    ms, res = medir(lambda h: find_next_page_url(BeautifulSoup(h, "html.parser")), listados)
+    reporte["find_next_page_url"] = {
+        "ms_por_pagina": round(ms, 3),
+        "con_siguiente": sum(1 for r in res if r),
+    }
+
+    ms, res = medir(lambda h: parse_list_page(h)[0], listados)
+    reporte["parse_list_page"] = {
+        "ms_por_pagina": round(ms, 3),
+        "ofertas_por_pagina": round(sum(map(len, res)) / len(res), 2) if res else 0,
+    }
+
+    pool = get_parse_pool()
+    list(pool.map(parse_list_html, listados[:1]))  # arranque de los procesos fuera de la medición
+    inicio = time.perf_counter()
+    res = list(pool.map(parse_list_html, listados))
+    total = time.perf_counter() - inicio
+    reporte["parse_list_html_pool"] = {
+        "procesos": pool.workers,
+        "ms_por_pagina": round(total * 1000 / len(listados), 3) if listados else 0.0,
+        "ofertas_por_pagina": round(sum(len(r["offers"]) for r in res) / len(res), 2) if res else 0,
+    }
+
+    ms, res = medir(lambda h: DescriptionScraper.extract_description_multi_selector(BeautifulSoup(h, "html.parser")), detalles)
+    reporte["extract_description_multi_selector"] = {
+        "ms_por_pagina": round(ms, 3),
+        "con_descripcion": sum(1 for r in res if r),
+    }
+
+    ms, res = medir(lambda h: extract_description_single_pass(BeautifulSoup(h, "html.parser"))[0], detalles)
+    reporte["extract_description_single_pass"] = {
+        "ms_por_pagina": round(ms, 3),
+        "con_descripcion": sum(1 for r in res if r),
+    }
+    return reporte
+
+
+def bench_fetch(directory, recordings, workers, latency):
+    """Descarga todas las grabaciones desde el servidor local con make_session."""
+    server = serve_recordings(directory, latency=latency)
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [base + path_key(meta["url"]) for meta, _ in recordings]
+    session = make_session(pool_size=max(10, workers))
+    try:
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            bytes_total = sum(len(r.content) for r in pool.map(lambda u: session.get(u, timeout=10), urls))
+        total = time.perf_counter() - inicio
+    finally:
+        server.shutdown()
+    return {
+        "paginas": len(urls),
+        "workers": workers,
+        "latencia_simulada_s": latency,
+        "paginas_por_segundo": round(len(urls) / total, 2) if total else None,
+        "bytes": bytes_total,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline de parsers y descargas")
+    parser.add_argument("--recordings", help="directorio con grabaciones (replay.py)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05, help="latencia simulada del servidor local")
+    args = parser.parse_args()
+
+    directory = args.recordings
+    if not directory:
+        directory = tempfile.mkdtemp(prefix="polimaniaco_bench_")
+        generar_sinteticas(directory)
+
+    recordings = load_recordings(directory)
+    reporte = {
+        "grabaciones": directory,
+        "parse": bench_parse(recordings),
+        "fetch": bench_fetch(directory, recordings, args.workers, args.latency),
+    }
+    print(json.dumps(reporte, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import delete, insert, select, update
+
 from app import create_app
 from app.extensions import db
-from app.models.models import AnalisisResultado
+from app.models.models import AnalisisResultado, Oferta, Perfil, PuntajePerfil
+from app.processing.compatibilidad import MatrizOfertas, calcular_compatibilidades, vector_perfil
 
 # ----------------- Perfil del usuario -----------------
 USER_PROFILE = {
@@ -116,47 +122,143 @@ def compute_final_score(stack_score, nivel_score):
         return max(0, stack_score - penalty)
 
 
+def skills_desde_columnas(columnas: dict) -> dict:
+    """Convierte {categoria: "a, b"} (formato de AnalisisResultado) en {categoria: [a, b]}."""
+    return {cat: valor.split(", ") if valor else [] for cat, valor in columnas.items()}
+
+
+def calcular_compatibilidad(analisis_skills: dict, nivel_score: int) -> float:
+    """Puntaje final (stack ponderado del perfil + factor de nivel), redondeado a 2 decimales."""
+    stack_score, _ = compute_compatibility(
+        analisis_skills, USER_PROFILE, CATEGORY_WEIGHTS, SKILL_WEIGHTS, MAX_SCORE
+    )
+    return round(compute_final_score(stack_score, nivel_score or 0), 2)
+
+
+# ----------------- Perfiles guardados -----------------
+# Columnas de stack de AnalisisResultado que pueden puntuar los perfiles
+CATEGORIAS = tuple(USER_PROFILE)
+
+# Filas de puntajes_perfil por INSERT masivo
+LOTE_PUNTAJES = 10000
+
+
+def asegurar_perfil_principal() -> Perfil:
+    """
+    Sincroniza el perfil principal de la DB con las constantes de este módulo, su única
+    fuente: calcular_compatibilidad (run_pipeline, reanalizar_taxonomia) y run_compatibility
+    escriben la misma columna compatibilidad y deben usar el mismo perfil.
+    """
+    datos = {"skills": USER_PROFILE, "pesos_categoria": CATEGORY_WEIGHTS, "pesos_skill": SKILL_WEIGHTS,
+             "max_score": MAX_SCORE, "activo": True}
+    perfil = Perfil.query.filter_by(nombre=Perfil.PRINCIPAL).first()
+    if perfil is None:
+        perfil = Perfil(nombre=Perfil.PRINCIPAL)
+        db.session.add(perfil)
+    if any(getattr(perfil, campo) != valor for campo, valor in datos.items()):
+        for campo, valor in datos.items():
+            setattr(perfil, campo, valor)
+        db.session.commit()
+    return perfil
+
+
 # ----------------- Ejecutar compatibilidad -----------------
+def puntajes_perfiles(filas, perfiles) -> tuple:
+    """
+    filas: (id, nivel_score, *columnas de CATEGORIAS); perfiles: (skills, pesos_categoria,
+    pesos_skill, max_score) por perfil. Devuelve (ids, puntajes oferta × perfil) con un solo
+    producto entre la matriz de ofertas y la matriz de pesos de todos los perfiles.
+    """
+    matriz = MatrizOfertas(CATEGORIAS)
+    ids, niveles = [], []
+    for analisis_id, nivel_score, *columnas in filas:
+        ids.append(analisis_id)
+        niveles.append(nivel_score)
+        matriz.agregar(columnas)
+    pesos = np.zeros((len(matriz.vocabulario), len(perfiles)), dtype=np.float64)
+    for j, (skills, pesos_categoria, pesos_skill, _) in enumerate(perfiles):
+        pesos[:, j] = vector_perfil(matriz.vocabulario, skills, pesos_categoria, pesos_skill)
+    max_scores = np.array([max_score for *_, max_score in perfiles], dtype=np.float64)
+    return ids, calcular_compatibilidades(matriz, niveles, pesos, max_scores)
+
+
+def puntajes_vectorizados(filas) -> tuple:
+    """Como puntajes_perfiles, solo para el perfil de las constantes del módulo: (ids, puntajes)."""
+    ids, puntajes = puntajes_perfiles(filas, [(USER_PROFILE, CATEGORY_WEIGHTS, SKILL_WEIGHTS, MAX_SCORE)])
+    return ids, puntajes[:, 0]
+
+
+def perfiles_activos() -> list:
+    """Perfiles a puntuar (el principal, sincronizado con las constantes, siempre incluido)."""
+    asegurar_perfil_principal()
+    return Perfil.query.filter_by(activo=True).order_by(Perfil.id).all()
+
+
+def datos_perfiles(perfiles) -> list:
+    """Perfiles en el formato de puntajes_perfiles."""
+    return [(p.skills, p.pesos_categoria, p.pesos_skill, p.max_score) for p in perfiles]
+
+
+def columna_principal(perfiles) -> int:
+    return next(j for j, p in enumerate(perfiles) if p.nombre == Perfil.PRINCIPAL)
+
+
+def guardar_puntajes(perfiles, ids, puntajes, solo_estos=False):
+    """
+    Reemplaza en puntajes_perfil los puntajes de estos perfiles (en la transacción en curso):
+    todos, o con `solo_estos` únicamente los de los análisis `ids`.
+    """
+    perfil_ids = [p.id for p in perfiles]
+    if not solo_estos:
+        db.session.execute(delete(PuntajePerfil).where(PuntajePerfil.perfil_id.in_(perfil_ids)))
+    else:
+        for i in range(0, len(ids), LOTE_PUNTAJES):
+            db.session.execute(delete(PuntajePerfil).where(PuntajePerfil.perfil_id.in_(perfil_ids),
+                                                           PuntajePerfil.analisis_id.in_(ids[i:i + LOTE_PUNTAJES])))
+    ahora = datetime.utcnow()
+    filas = [
+        {"perfil_id": perfil_id, "analisis_id": analisis_id, "compatibilidad": puntaje, "calculado_en": ahora}
+        for analisis_id, fila in zip(ids, puntajes.tolist())
+        for perfil_id, puntaje in zip(perfil_ids, fila)
+    ]
+    for i in range(0, len(filas), LOTE_PUNTAJES):
+        db.session.execute(insert(PuntajePerfil), filas[i:i + LOTE_PUNTAJES])
+
+
 def run_compatibility():
     app = create_app()
     with app.app_context():
-        analisis_list = AnalisisResultado.query.all()
-
-        for a in analisis_list:
-            # Extraemos stack de la oferta como listas
-            analisis_skills = {
-                "lenguajes": a.lenguajes.split(", ") if a.lenguajes else [],
-                "frameworks": a.frameworks.split(", ") if a.frameworks else [],
-                "librerias": a.librerias.split(", ") if a.librerias else [],
-                "bases_datos": a.bases_datos.split(", ") if a.bases_datos else [],
-                "nube_devops": a.nube_devops.split(", ") if a.nube_devops else [],
-                "control_versiones": a.control_versiones.split(", ") if a.control_versiones else [],
-                "arquitectura_metodologias": a.arquitectura_metodologias.split(", ") if a.arquitectura_metodologias else [],
-                "integraciones": a.integraciones.split(", ") if a.integraciones else [],
-                "inteligencia_artificial": a.inteligencia_artificial.split(", ") if a.inteligencia_artificial else [],
-                "ofimatica_gestion": a.ofimatica_gestion.split(", ") if a.ofimatica_gestion else [],
-                "ciberseguridad": a.ciberseguridad.split(", ") if a.ciberseguridad else [],
-                "marketing_digital": a.marketing_digital.split(", ") if a.marketing_digital else [],
-                "erp_lowcode": a.erp_lowcode.split(", ") if a.erp_lowcode else [],
-            }
-
-            # Calcular puntaje de stack (sin cambios)
-            stack_score, detalle = compute_compatibility(
-                analisis_skills, USER_PROFILE, CATEGORY_WEIGHTS, SKILL_WEIGHTS, MAX_SCORE
-            )
-
-            # 🆕 NUEVO: Ajustar con factor de nivel
-            nivel_score = a.nivel_score or 0
-            final_score = compute_final_score(stack_score, nivel_score)
-
-            # Asignar puntaje final y URL
-            a.compatibilidad = round(final_score, 2)
-            a.url = a.oferta.url if a.oferta else None
+        perfiles = perfiles_activos()
+        columnas = [getattr(AnalisisResultado, cat) for cat in CATEGORIAS]
+        query = db.session.query(AnalisisResultado.id, AnalisisResultado.nivel_score, *columnas)
+        ids, puntajes = puntajes_perfiles(query.yield_per(5000), datos_perfiles(perfiles))
 
+        # El perfil principal (siempre activo) sigue alimentando analisis_resultados.compatibilidad
+        principal = columna_principal(perfiles)
+        if ids:
+            db.session.execute(
+                update(AnalisisResultado),
+                [{"id": i, "compatibilidad": p} for i, p in zip(ids, puntajes[:, principal].tolist())],
+            )
+        guardar_puntajes(perfiles, ids, puntajes)
+        # Asignar URL en un solo UPDATE desde ofertas
+        db.session.execute(
+            update(AnalisisResultado)
+            .values(url=select(Oferta.url).where(Oferta.id == AnalisisResultado.oferta_id).scalar_subquery())
+            .execution_options(synchronize_session=False)
+        )
         db.session.commit()
 
+        for j, perfil in enumerate(perfiles):
+            columna = puntajes[:, j]
+            promedio = columna.mean() if len(columna) else 0
+            maximo = columna.max() if len(columna) else 0
+            print(f"[perfiles] {perfil.nombre}: {len(columna)} ofertas | promedio {promedio:.2f} | máximo {maximo:.2f}")
+
         # Mostrar resultados ordenados (top 10)
-        resultados_ordenados = sorted(analisis_list, key=lambda x: x.compatibilidad, reverse=True)
+        resultados_ordenados = (AnalisisResultado.query
+                                .order_by(AnalisisResultado.compatibilidad.desc(), AnalisisResultado.id)
+                                .limit(10).all())
         print("\n" + "="*80)
         print("TOP 10 OFERTAS MÁS COMPATIBLES")
         print("="*80)
@@ -1,6 +1,7 @@
 from app import create_app
 from app.extensions import db
 from app.models.models import (
+    Oferta,
     AnalisisResultado,
     MetricasTecnologia,
     MetricasUbicacion,
@@ -13,7 +14,9 @@ from datetime import datetime
 def calcular_metricas():
     app = create_app()
     with app.app_context():
-        resultados = AnalisisResultado.query.all()
+        # Sin casi-duplicados: una vacante re-publicada cuenta una sola vez
+        resultados = (AnalisisResultado.query.join(Oferta, AnalisisResultado.oferta_id == Oferta.id)
+                      .filter(Oferta.duplicado_de.is_(None)).all())
         total_ofertas = len(resultados)
 
         if total_ofertas == 0:
@@ -0,0 +1,50 @@
+"""
+Marca las ofertas ya guardadas que son re-publicaciones casi idénticas de otra
+(ofertas.duplicado_de), para que no se vuelvan a procesar ni cuenten dos veces.
+Solo se comparan ofertas con descripción completa de la misma empresa (ver
+app/scrapers/computrabajo/dedup.py); la más antigua queda como original.
+
+Uso:
+    python -m scripts.marcar_duplicados [--dry-run]
+"""
+import argparse
+
+from sqlalchemy import update
+
+from app import create_app
+from app.extensions import db
+from app.models import Oferta
+from app.scrapers.computrabajo.dedup import NearDuplicateIndex, empresa_clave, orden_oferta
+
+
+def marcar_duplicados(dry_run=False):
+    app = create_app()
+    with app.app_context():
+        por_descripcion = NearDuplicateIndex()
+        ids = {}
+        cambios = []
+        query = (db.session.query(Oferta.id, Oferta.url, Oferta.titulo, Oferta.empresa, Oferta.descripcion,
+                                  Oferta.fecha_publicacion)
+                 .filter(Oferta.duplicado_de.is_(None), Oferta.descripcion_estado == Oferta.DESC_OBTENIDA)
+                 .order_by(Oferta.fecha_publicacion, Oferta.id))
+        for oferta_id, url, titulo, empresa, descripcion, fecha in query.yield_per(5000):
+            if not url:
+                continue
+            ids[url] = oferta_id
+            # De la más antigua a la más nueva: la indexada siempre es la original
+            par = por_descripcion.add(url, f"{titulo} {descripcion}", empresa_clave(empresa), titulo,
+                                      orden_oferta(fecha, oferta_id))
+            if par is not None:
+                cambios.append({"id": ids[par[0]], "duplicado_de": ids[par[1]]})
+
+        print(f"[duplicados] Revisadas: {len(ids)} | Casi-duplicadas: {len(cambios)}")
+        if cambios and not dry_run:
+            db.session.execute(update(Oferta), cambios)
+            db.session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Marca ofertas casi duplicadas (MinHash + LSH)")
+    parser.add_argument("--dry-run", action="store_true", help="no escribe en la DB")
+    args = parser.parse_args()
+    marcar_duplicados(args.dry_run)
@@ -0,0 +1,88 @@
+"""
+Perfiles de candidato guardados en la DB (tabla perfiles). Cada perfil activo se
+puntúa contra todas las ofertas en cada corrida de scripts.calc_compatibilidad.
+
+El perfil "principal" es de solo lectura: se define con las constantes de
+scripts/calc_compatibilidad.py y no se puede importar ni desactivar.
+
+El archivo a importar es una lista JSON de perfiles; los que ya existen (mismo
+nombre) se actualizan:
+    [{"nombre": "backend", "skills": {"lenguajes": ["python", "sql"]},
+      "pesos_categoria": {"lenguajes": 3}, "pesos_skill": {"python": 5},
+      "max_score": 100, "activo": true}]
+
+Uso:
+    python -m scripts.perfiles --importar perfiles.json
+    python -m scripts.perfiles --listar
+    python -m scripts.perfiles --desactivar NOMBRE
+"""
+import argparse
+import json
+
+from sqlalchemy import func
+
+from app import create_app
+from app.extensions import db
+from app.models.models import Perfil, PuntajePerfil
+from scripts.calc_compatibilidad import CATEGORIAS, asegurar_perfil_principal
+
+
+def importar(path):
+    with open(path, "r", encoding="utf-8") as f:
+        datos = json.load(f)
+    if any(d["nombre"] == Perfil.PRINCIPAL for d in datos):
+        print(f"[perfiles] {Perfil.PRINCIPAL!r} se edita en scripts/calc_compatibilidad.py; no se importó nada")
+        return
+    for d in datos:
+        desconocidas = set(d["skills"]) - set(CATEGORIAS)
+        if desconocidas:
+            print(f"[perfiles] {d['nombre']}: categorías ignoradas {sorted(desconocidas)}")
+        perfil = Perfil.query.filter_by(nombre=d["nombre"]).first() or Perfil(nombre=d["nombre"])
+        perfil.skills = d["skills"]
+        perfil.pesos_categoria = d.get("pesos_categoria") or {}
+        perfil.pesos_skill = d.get("pesos_skill") or {}
+        perfil.max_score = d.get("max_score", 100)
+        perfil.activo = d.get("activo", True)
+        db.session.add(perfil)
+    db.session.commit()
+    print(f"[perfiles] Importados: {len(datos)}")
+
+
+def listar():
+    conteos = dict(db.session.query(PuntajePerfil.perfil_id, func.count(PuntajePerfil.id))
+                   .group_by(PuntajePerfil.perfil_id).all())
+    for p in Perfil.query.order_by(Perfil.id).all():
+        skills = sum(len(s) for s in p.skills.values())
+        estado = "activo" if p.activo else "inactivo"
+        print(f"{p.id:>4}  {p.nombre:<30} {estado:<9} {skills:>3} skills  {conteos.get(p.id, 0):>6} puntajes")
+
+
+def desactivar(nombre):
+    if nombre == Perfil.PRINCIPAL:
+        print(f"[perfiles] {nombre!r} no se puede desactivar: alimenta analisis_resultados.compatibilidad")
+        return
+    perfil = Perfil.query.filter_by(nombre=nombre).first()
+    if perfil is None:
+        print(f"[perfiles] No existe el perfil {nombre!r}")
+        return
+    perfil.activo = False
+    db.session.commit()
+    print(f"[perfiles] {nombre} desactivado")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Perfiles de candidato para el cálculo de compatibilidad")
+    parser.add_argument("--importar", metavar="ARCHIVO", help="lista JSON de perfiles a crear o actualizar")
+    parser.add_argument("--listar", action="store_true", help="muestra los perfiles guardados")
+    parser.add_argument("--desactivar", metavar="NOMBRE", help="deja de puntuar un perfil")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        asegurar_perfil_principal()
+        if args.importar:
+            importar(args.importar)
+        if args.desactivar:
+            desactivar(args.desactivar)
+        if args.listar or not (args.importar or args.desactivar):
+            listar()
@@ -0,0 +1,99 @@
+"""
+Re-analiza solo las ofertas cuyo stack puede cambiar con la versión actual de
+app/processing/taxonomia.json.
+
+Para los análisis hechos con una versión anterior (o sin versión) se juntan las
+palabras clave que cambiaron desde entonces y, con un índice invertido por token
+de las descripciones, se buscan las ofertas que las contienen. Solo esas se
+vuelven a extraer y se vuelven a puntuar para todos los perfiles activos
+(compatibilidad y puntajes_perfil); al resto se le actualiza la versión sin tocar
+el análisis.
+
+Uso:
+    python -m scripts.reanalizar_taxonomia [--dry-run]
+"""
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy import or_, update
+
+from app import create_app
+from app.extensions import db
+from app.models.models import AnalisisResultado, Oferta
+from app.processing.matcher import KeywordMatcher
+from app.processing.taxonomia import VERSION_INICIAL, candidatas, get_taxonomia, indice_invertido
+from app.processing.utils import normalize_text
+from run_processing import extraer_stack
+from scripts.calc_compatibilidad import (
+    CATEGORIAS, columna_principal, datos_perfiles, guardar_puntajes, perfiles_activos, puntajes_perfiles
+)
+
+
+def afectadas(textos: dict, palabras: set) -> set:
+    """Ids de `textos` (normalizados) en los que aparece alguna de las palabras."""
+    if not palabras or not textos:
+        return set()
+    indice = indice_invertido(textos)
+    matcher = KeywordMatcher(palabras)
+    return {i for i in candidatas(indice, palabras, set(textos)) if matcher.find_all(textos[i])}
+
+
+def reanalizar(dry_run=False):
+    taxonomia = get_taxonomia()
+    app = create_app()
+    with app.app_context():
+        desactualizada = or_(AnalisisResultado.taxonomia_version.is_(None),
+                             AnalisisResultado.taxonomia_version < taxonomia.version)
+        query = (db.session.query(AnalisisResultado.id, AnalisisResultado.taxonomia_version,
+                                  AnalisisResultado.nivel_score, Oferta.descripcion)
+                 .join(Oferta, AnalisisResultado.oferta_id == Oferta.id)
+                 .filter(desactualizada))
+
+        # Agrupadas por versión: cada una tiene su propio conjunto de palabras cambiadas
+        por_version = {}
+        for resultado_id, version, nivel_score, descripcion in query.yield_per(5000):
+            por_version.setdefault(version, {})[resultado_id] = (descripcion or "", nivel_score)
+
+        inicio = time.perf_counter()
+        cambios = []
+        niveles = {}
+        for version, filas in por_version.items():
+            palabras = taxonomia.palabras_cambiadas(version)
+            textos = {i: normalize_text(desc) for i, (desc, _) in filas.items()}
+            ids = afectadas(textos, palabras)
+            print(f"[taxonomia] v{version or VERSION_INICIAL} → v{taxonomia.version}: "
+                  f"{len(filas)} análisis, {len(palabras)} palabras cambiadas, {len(ids)} a re-analizar")
+            for i in ids:
+                campos = extraer_stack(textos[i], normalizado=True)
+                campos.update(id=i, taxonomia_version=taxonomia.version, fecha_analisis=datetime.utcnow())
+                cambios.append(campos)
+                niveles[i] = filas[i][1]
+
+        # Stack nuevo → puntajes nuevos para todos los perfiles, en un solo producto matricial
+        perfiles = perfiles_activos()
+        ids, puntajes = puntajes_perfiles(
+            [(c["id"], niveles[c["id"]], *(c[cat] for cat in CATEGORIAS)) for c in cambios],
+            datos_perfiles(perfiles),
+        )
+        for c, compatibilidad in zip(cambios, puntajes[:, columna_principal(perfiles)].tolist()):
+            c["compatibilidad"] = compatibilidad
+
+        total = sum(map(len, por_version.values()))
+        print(f"[taxonomia] Desactualizados: {total} | Re-analizados: {len(cambios)} | "
+              f"Solo versión: {total - len(cambios)} | {time.perf_counter() - inicio:.2f}s")
+        if total and not dry_run:
+            if cambios:
+                db.session.execute(update(AnalisisResultado), cambios)
+                guardar_puntajes(perfiles, ids, puntajes, solo_estos=True)
+            # Al resto la taxonomía nueva le daría el mismo resultado: solo se marca la versión
+            db.session.execute(update(AnalisisResultado).where(desactualizada)
+                               .values(taxonomia_version=taxonomia.version))
+            db.session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-análisis selectivo tras cambiar la taxonomía")
+    parser.add_argument("--dry-run", action="store_true", help="no escribe en la DB")
+    args = parser.parse_args()
+    reanalizar(args.dry_run)
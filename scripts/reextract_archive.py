@@ -0,0 +1,89 @@
+"""
+Re-ejecuta la extracción de descripciones sobre el archivo local de HTML
+(app/scrapers/computrabajo/archive.py), sin hacer ningún request.
+
+Uso:
+    python -m scripts.reextract_archive                  # todas las ofertas archivadas
+    python -m scripts.reextract_archive --solo-faltantes # solo las que no tienen descripción obtenida
+    python -m scripts.reextract_archive --dry-run --workers 8
+"""
+import argparse
+import time
+
+from sqlalchemy import update
+
+from app import create_app
+from app.extensions import db
+from app.models import Oferta
+from app.scrapers.computrabajo.archive import HtmlArchive, read_blob
+from app.scrapers.computrabajo.description_extractor import SelectorStats
+from app.scrapers.computrabajo.config import HTML_ARCHIVE_DIR, PARSE_WORKERS
+from app.scrapers.computrabajo.parsing import ParsePool, parse_detail_html
+
+# Filas por UPDATE masivo + commit
+CHUNK_SIZE = 500
+
+
+def extraer_descripcion(tarea):
+    """Corre en un proceso del pool: lee el blob del disco y extrae la descripción (+ estrategia)."""
+    directory, sha = tarea
+    return parse_detail_html(read_blob(directory, sha))
+
+
+def reextraer(directory=HTML_ARCHIVE_DIR, workers=PARSE_WORKERS, solo_faltantes=False, dry_run=False):
+    archive = HtmlArchive(directory)
+    paginas = {url: sha for url, sha, _ in archive.latest("detail")}
+    print(f"[reextract] Archivo: {archive.stats()}")
+
+    app = create_app()
+    with app.app_context():
+        query = db.session.query(Oferta.id, Oferta.url, Oferta.descripcion)
+        if solo_faltantes:
+            query = query.filter(Oferta.descripcion_estado != Oferta.DESC_OBTENIDA)
+        ofertas = [(oferta_id, url, desc) for oferta_id, url, desc in query.yield_per(5000) if url in paginas]
+        print(f"[reextract] Ofertas con página archivada: {len(ofertas)}")
+
+        inicio = time.perf_counter()
+        pool = ParsePool(workers)
+        cambios = []
+        cambiadas = 0
+        sin_descripcion = 0
+        estrategias = SelectorStats()
+        try:
+            tareas = [(directory, paginas[url]) for _, url, _ in ofertas]
+            for (oferta_id, url, actual), parsed in zip(ofertas, pool.map(extraer_descripcion, tareas, chunksize=16)):
+                estrategias.record(parsed["strategy"])
+                desc = parsed["description"]
+                if not desc or "acceso denegado" in desc.lower():
+                    sin_descripcion += 1
+                    continue
+                if desc == actual:
+                    continue
+                cambiadas += 1
+                if dry_run:
+                    continue
+                cambios.append({"id": oferta_id, "descripcion": desc, "descripcion_estado": Oferta.DESC_OBTENIDA})
+                if len(cambios) >= CHUNK_SIZE:
+                    db.session.execute(update(Oferta), cambios)
+                    db.session.commit()
+                    cambios = []
+            if cambios:
+                db.session.execute(update(Oferta), cambios)
+                db.session.commit()
+        finally:
+            pool.shutdown()
+
+        total = time.perf_counter() - inicio
+        print(f"[reextract] Revisadas: {len(ofertas)} | Cambiadas: {cambiadas} | Sin descripción: {sin_descripcion}"
+              f" | {total:.1f}s{' (dry-run, sin escribir)' if dry_run else ''}")
+        print(f"[reextract] Selectores: {estrategias.snapshot()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-extrae descripciones desde el archivo de HTML, sin red")
+    parser.add_argument("--archive", default=HTML_ARCHIVE_DIR, help="directorio del archivo")
+    parser.add_argument("--workers", type=int, default=PARSE_WORKERS, help="procesos de parseo (0 = en serie)")
+    parser.add_argument("--solo-faltantes", action="store_true", help="solo ofertas sin descripción obtenida")
+    parser.add_argument("--dry-run", action="store_true", help="no escribe en la DB")
+    args = parser.parse_args()
+    reextraer(args.archive, args.workers, args.solo_faltantes, args.dry_run)